@@ -484,15 +484,15 @@ class IRGenerator:
             return type_str
             
         if type_str == "int":
-            return IntType()
+            return INT
         elif type_str == "tileset":
-            return TilesetType()
+            return TILESET
         elif type_str == "tilemap":
-            return TileMapType()
+            return TILEMAP
         elif type_str == "sprite":
-            return SpriteType()
+            return SPRITE
         elif type_str == "void":
-            return VoidType()
+            return VOID
         else:
             raise ValueError(f"Unknown type: {type_str}")
     
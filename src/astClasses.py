@@ -9,7 +9,8 @@ from __future__ import annotations  # Enables postponed evaluation of annotation
 # Stdlib imports
 import os
 import sys
-from typing import Optional, Union, List, Tuple, TYPE_CHECKING
+from weakref import WeakValueDictionary
+from typing import Any, Optional, Union, List, Tuple, Iterator, TYPE_CHECKING, get_type_hints, get_origin, get_args
 
 # Extend module paths
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -20,8 +21,95 @@ if TYPE_CHECKING:
     from src.astClasses import ProcedureCall
 
 
+# Sættes når classify_node_fields har kørt, så senere node klasser klassificeres når de oprettes
+_fields_classified: bool = False
+
+# Literal noder med samme klasse og værdi deles (hash-consing), så ens literals er samme objekt
+_intern_cache: WeakValueDictionary = WeakValueDictionary()
+
+
 class ASTNode():
-    """AST Base Class."""
+    """AST Base Class.
+    
+    The fields of each node class are its constructor parameters. They are classified once
+    at import time (see classify_node_fields) into fields that can hold a node, a list of nodes
+    or only a plain value, so structural comparison and traversal do not have to inspect every field.
+    """
+    
+    # var_type deles af alle noder, da type checkeren sætter den på de fleste noder efter konstruktion
+    __slots__ = ('var_type',)
+    
+    _fields: Tuple[str, ...] = ()
+    _node_fields: Tuple[str, ...] = ()
+    _node_list_fields: Tuple[str, ...] = ()
+    _scalar_fields: Tuple[str, ...] = ()
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        
+        # The constructor parameters (minus self) are the fields of the node, in order.
+        # A class without its own Python constructor keeps the fields it inherited
+        code = getattr(cls.__dict__.get('__init__'), '__code__', None)
+        if code is not None:
+            cls._fields = code.co_varnames[1:code.co_argcount]
+            
+            # Classes defined after the module has been imported are classified right away
+            if _fields_classified:
+                _classify_class(cls)
+    
+    def iter_child_nodes(self) -> Iterator[ASTNode]:
+        """Iterate over the direct child nodes of this node.
+        
+        Yields:
+            ASTNode: Each child node, in field order.
+        """
+        
+        for field in self._node_fields:
+            child = getattr(self, field)
+            # fields like Variable.name can hold a plain name instead of a node
+            if isinstance(child, ASTNode):
+                yield child
+        
+        for field in self._node_list_fields:
+            yield from getattr(self, field) or ()
+
+    # Noder sammenlignes og hashes på identitet, så de kan bruges som nøgler i memo tabeller.
+    # Hele træer sammenlignes strukturelt med same_structure
+    
+    def same_structure(self, other: ASTNode) -> bool:
+        """Check if two trees have the same structure, short-circuiting on identical subtrees.
+        
+        Walks both trees with an explicit stack rather than recursion, so long operator
+        chains compare without growing the Python call stack.
+        
+        Returns:
+            bool: True if other is the same node, or a node of the same class whose fields
+                and child nodes are equal all the way down.
+        """
+        
+        # Pairs of nodes still to compare
+        stack: List[Tuple[ASTNode, ASTNode]] = [(self, other)]
+        
+        while stack:
+            left, right = stack.pop()
+            if left is not right and not _same_fields(left, right, stack):
+                return False
+        
+        return True
+    
+    def iter_fields(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over the (name, value) pairs of this node.
+        
+        Yields:
+            tuple: The constructor fields in order, followed by var_type if the type checker has set it.
+        """
+        
+        for field in self._fields:
+            yield field, getattr(self, field)
+        
+        # var_type sættes af type checkeren på noder, der ikke har den som felt
+        if "var_type" not in self._fields and getattr(self, "var_type", None) is not None:
+            yield "var_type", self.var_type
 
     def __repr__(self) -> str:
         """___repr__ method
@@ -31,10 +119,49 @@ class ASTNode():
         """
         
         classname = self.__class__.__name__
-        fields = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.iter_fields())
         return f"{classname}({fields})"
 
 
+def _interned(cls: type, value: Union[int, str]) -> ASTNode:
+    """Return the shared node for (cls, value), creating it on first use.
+    
+    The value is only set here, when the node is created, so constructing the same
+    literal again never changes a node that is already shared. The type of the value is
+    part of the key, since 1 == True and hash(1) == hash(True).
+    """
+    
+    key = (cls, type(value), value)
+    node = _intern_cache.get(key)
+    
+    if node is None:
+        node = object.__new__(cls)
+        node.value = value
+        _intern_cache[key] = node
+    
+    return node
+
+
+class _InternedLiteral(ASTNode):
+    """Base class for literal nodes that are shared (hash-consed) by class and value.
+    
+    All of the sharing rules live here, so a shared literal is never modified.
+    """
+    
+    __slots__ = ('value', '__weakref__')
+    
+    def __new__(cls, value: Union[int, str]) -> _InternedLiteral:
+        return _interned(cls, value)
+    
+    def __init__(self, value: Union[int, str]) -> None:
+        # value er allerede sat af __new__, og en delt node må ikke ændres
+        pass
+    
+    def __getnewargs__(self) -> Tuple[Union[int, str]]:
+        # copy og pickle kalder __new__ med value, så kopien er den delte node
+        return (self.value,)
+
+
 """Note to self
 
 Order og classes: 
@@ -81,8 +208,11 @@ class example(ASTNode):
         value (Any): The value of the node.
     """
     
+    __slots__ = ('value',)
+    
     def __init__(self, value: ASTNode) -> None:
-        super().__init__(None, value=value)
+        # ASTNode har ingen konstruktør, så felterne sættes direkte som i de andre noder
+        self.value = value
 
 
 """Program"""
@@ -98,6 +228,8 @@ class Program(ASTNode):
         statements (list[ASTNode]): The statements in the program.
     """
     
+    __slots__ = ('statements',)
+    
     def __init__(self, statements: List[ASTNode]) -> None:
         self.statements = statements
         
@@ -116,6 +248,8 @@ class Declaration(ASTNode):
         name (str): The name of the variable.
     """
     
+    __slots__ = ('name',)
+    
     def __init__(self, var_type: str, name: str) -> None: 
         self.var_type = var_type
         self.name = name
@@ -132,6 +266,8 @@ class Assignment(ASTNode):
         value (Any): The value to assign to the target. (Variable, Number, String, ListAccess, AttributeAccess)
     """
     
+    __slots__ = ('target', 'value')
+    
     def __init__(self, target: ASTNode, value: ASTNode) -> None:
         self.target = target
         self.value = value
@@ -149,6 +285,8 @@ class Initialization(ASTNode):
         value (Any): The value to assign to the target. (Variable, Number, String, ListAccess, AttributeAccess)
     """
     
+    __slots__ = ('name', 'value')
+    
     def __init__(self, var_type: str, name: str, value: ASTNode) -> None:
         self.var_type = var_type
         self.name = name
@@ -166,6 +304,8 @@ class ListInitialization(ASTNode):
         value (Any): The value to assign to the target. (Variable, Number, String, ListAccess, AttributeAccess)
     """
     
+    __slots__ = ('name', 'values')
+    
     def __init__(self, name: str, values: List[ASTNode]) -> None: 
         self.name = name
         self.values = values
@@ -183,10 +323,12 @@ class Conditional(ASTNode):
         else_body (list[ASTNode]): Default: None. The statements to execute if the condition is false. 
     """
     
+    __slots__ = ('condition', 'then_body', 'else_body')
+    
     def __init__(self, condition: ASTNode, then_body: List[ASTNode], else_body: Optional[List[ASTNode]] = None) -> None:
         self.condition = condition
         self.then_body = then_body # Liste of statements
-        self.else_body = else_body or [] # Liste of statements, men kan være tom
+        self.else_body = [] if else_body is None else else_body # Liste of statements, men kan være tom
 
 
 class Loop(ASTNode):
@@ -200,6 +342,8 @@ class Loop(ASTNode):
         body (list[ASTNode]): The statements to execute if the condition is true.
     """
     
+    __slots__ = ('condition', 'body')
+    
     def __init__(self, condition: ASTNode, body: List[ASTNode]) -> None:
         self.condition = condition
         self.body = body # Liste of statements
@@ -215,6 +359,8 @@ class Return(ASTNode):
         value (Any): The value to return from the function. (Sematically should only be integers)
     """
     
+    __slots__ = ('value',)
+    
     def __init__(self, value: ASTNode) -> None: 
         self.value = value 
 
@@ -226,7 +372,9 @@ class ProcedureCallStatement(ASTNode):
     Call (str): The name of the procedure to call.
     """
     
-    def __init__(self, call: "ProcedureCall") -> None: # noqa: ProcedureCall
+    __slots__ = ('call',)
+    
+    def __init__(self, call: ProcedureCall) -> None: # noqa: ProcedureCall
         # ProcedureCall er en klasse, der repræsenterer et procedurekald
         # Den indeholder navnet på proceduren og argumenterne
         # som en liste af AST-noder
@@ -249,6 +397,8 @@ class BinaryOp(ASTNode):
         right (ASTNode): The right operand of the binary operation.
     """
     
+    __slots__ = ('left', 'op', 'right')
+    
     def __init__(self, left: ASTNode, op: str, right: ASTNode) -> None:
         self.left = left
         self.op = op
@@ -266,12 +416,14 @@ class UnaryOp(ASTNode):
         operand (ASTNode): The operand of the unary operation.
     """
     
+    __slots__ = ('op', 'operand')
+    
     def __init__(self, op: str, operand: ASTNode) -> None:
         self.op = op
         self.operand = operand
 
 
-class IntegerLiteral(ASTNode):
+class IntegerLiteral(_InternedLiteral):
     """Integer Literal Expression AST Node.
     
     Args:
@@ -281,13 +433,12 @@ class IntegerLiteral(ASTNode):
         value (str): The value of the integer.
     """
     
-    def __init__(self, value: Union[int, str]) -> None:
-        # value kan være int eller str, da det kan være en hex- eller binærværdi
-        # burde enlig bare være str, men det er lidt mere "pænt" at have det som int
-        self.value = value
+    # value kan være int eller str, da det kan være en hex- eller binærværdi
+    # burde enlig bare være str, men det er lidt mere "pænt" at have det som int
+    __slots__ = ()
         
 
-class StringLiteral(ASTNode):
+class StringLiteral(_InternedLiteral):
     """String Literal Expression AST Node.
     
     Args:
@@ -297,9 +448,8 @@ class StringLiteral(ASTNode):
         value (str): The value of the string.
     """
     
-    def __init__(self, value: str) -> None:
-        # value kan være str, da det er det det er
-        self.value = value
+    
+    __slots__ = ()
         
 
 class Variable(ASTNode):
@@ -309,10 +459,12 @@ class Variable(ASTNode):
         ASTNode (none): Base class for all AST nodes.
         
     Attributes:
-        name (str): The name of the variable.
+        name (str | AttributeAccess): The name of the variable, or the attribute access it refers to.
     """
     
-    def __init__(self, var_type: str, name: str) -> None:
+    __slots__ = ('name',)
+    
+    def __init__(self, var_type: str, name: Union[str, AttributeAccess]) -> None:
         self.var_type = var_type
         self.name = name
         
@@ -324,11 +476,13 @@ class ListAccess(ASTNode):
         ASTNode (none): Base class for all AST nodes.
         
     Attributes:
-        name (str): The name of the list.
+        name (ASTNode): The name of the list.
         index (int): The index of the element in the list.
     """
     
-    def __init__(self, name: str, indices: List[ASTNode]) -> None:
+    __slots__ = ('name', 'indices')
+    
+    def __init__(self, name: Union[str, ASTNode], indices: List[ASTNode]) -> None:
         self.name = name
         self.indices = indices # En liste af expressions, som repræsenterer indekserne
 
@@ -340,11 +494,13 @@ class AttributeAccess(ASTNode):
         ASTNode (none): Base class for all AST nodes.
         
     Attributes:
-        name (str): The name of the attribute.
+        name (ASTNode): The node the attribute is accessed on.
         attribute (str): The name of the attribute to access.
     """
     
-    def __init__(self, name: str, attribute: str) -> None:
+    __slots__ = ('name', 'attribute')
+    
+    def __init__(self, name: Union[str, ASTNode], attribute: str) -> None:
         self.name = name
         self.attribute = attribute 
         
@@ -356,11 +512,13 @@ class ProcedureCall(ASTNode):
         ASTNode (none): Base class for all AST nodes.
         
     Attributes:
-        name (str): The name of the procedure to call.
+        name (ASTNode): The name of the procedure to call.
         args (list[ASTNode]): The arguments to pass to the procedure.
     """
     
-    def __init__(self, name: str, params: List[ASTNode]) -> None:
+    __slots__ = ('name', 'params')
+    
+    def __init__(self, name: ASTNode, params: List[ASTNode]) -> None:
         self.name = name
         self.params = params
 
@@ -380,11 +538,96 @@ class ProcedureDef(ASTNode):
         body (list[ASTNode]): The body of the procedure.
     """
     
+    __slots__ = ('return_type', 'name', 'params', 'body')
+    
     def __init__(self, return_type: Optional[str], name: str, 
-                 params: List[Tuple[str, str]], body: List[ASTNode]) -> None: 
+                 params: List[Declaration], body: List[ASTNode]) -> None: 
         # Optional[str] for return_type, da det kan være None
-        # List[Tuple[str, str]] for params, da det er en liste af tuples med (type, name)
+        # List[Declaration] for params, da hver parameter er en deklaration med type og navn
         self.return_type = return_type 
         self.name = name
         self.params = params
         self.body = body
+
+
+def _same_fields(left: ASTNode, right: ASTNode, stack: List[Tuple[ASTNode, ASTNode]]) -> bool:
+    """Compare the fields of two nodes for same_structure, pushing their pairs of child nodes onto stack.
+    
+    Returns:
+        bool: False as soon as the classes or a plain value differ, True otherwise.
+    """
+    
+    node_class = type(left)
+    if node_class is not type(right):
+        return False
+    
+    # plain values are cheapest to compare, so they are checked before the child nodes
+    for field in node_class._scalar_fields:
+        if getattr(left, field) != getattr(right, field):
+            return False
+    
+    for field in node_class._node_fields:
+        left_child, right_child = getattr(left, field), getattr(right, field)
+        if isinstance(left_child, ASTNode) and isinstance(right_child, ASTNode):
+            stack.append((left_child, right_child))
+        # fields like Variable.name can also hold a plain name, or None
+        elif left_child != right_child:
+            return False
+    
+    for field in node_class._node_list_fields:
+        left_children, right_children = getattr(left, field), getattr(right, field)
+        if left_children is right_children:
+            continue
+        if left_children is None or right_children is None or len(left_children) != len(right_children):
+            return False
+        stack.extend(zip(left_children, right_children))
+    
+    return True
+
+
+def _node_type(hint) -> Optional[str]:
+    """Classify a type hint as "node" (can hold a node), "list" (of nodes) or None for a plain value."""
+    
+    # Optional[X] is Union[X, None], and a field like Union[str, AttributeAccess] can hold a node
+    if get_origin(hint) is Union:
+        kinds = {_node_type(arg) for arg in get_args(hint) if arg is not type(None)}
+        if "node" in kinds:
+            return "node"
+        return "list" if kinds == {"list"} else None
+    
+    if get_origin(hint) is list:
+        args = get_args(hint)
+        return "list" if args and _node_type(args[0]) == "node" else None
+    
+    return "node" if isinstance(hint, type) and issubclass(hint, ASTNode) else None
+
+
+def _classify_class(cls: type) -> None:
+    """Split the fields of a single node class by the type hints of its own constructor."""
+    
+    hints = get_type_hints(cls.__init__)
+    kinds = {field: _node_type(hints.get(field)) for field in cls._fields}
+    
+    cls._node_fields = tuple(f for f in cls._fields if kinds[f] == "node")
+    cls._node_list_fields = tuple(f for f in cls._fields if kinds[f] == "list")
+    cls._scalar_fields = tuple(f for f in cls._fields if kinds[f] is None)
+
+
+def classify_node_fields(cls: type = ASTNode) -> None:
+    """Split the fields of cls and all its subclasses by the type hints of their constructors.
+    
+    Runs once when the module is imported, after every node class exists to resolve the hints.
+    Classes without their own constructor keep the classification they inherit.
+    """
+    global _fields_classified
+    
+    for sub in cls.__subclasses__():
+        if hasattr(sub.__dict__.get('__init__'), '__code__'):
+            _classify_class(sub)
+        
+        classify_node_fields(sub)
+    
+    _fields_classified = True
+
+
+classify_node_fields()
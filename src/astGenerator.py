@@ -35,7 +35,7 @@ Note til gruppemedlemmer fra Naitsa:
 # Stdlib imports
 import os
 import sys
-from typing import List, Tuple, Union, Any
+from typing import List, Tuple, Union, Any, Optional, Dict, Callable
 
 # Extend module paths
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -50,6 +50,27 @@ from src.customErrors import *
 from src.logger import logger
 
 
+# Navnet på visit metoden for hver context klasse sættes én gang ved import (ProgramContext -> visitProgram),
+# så visit() ikke skal gå gennem accept() og hasattr for hver node
+CONTEXT_CLASSES: Tuple[type, ...] = tuple(
+    cls for cls in vars(penguinParser).values()
+    if isinstance(cls, type) and cls.__name__.endswith("Context")
+)
+
+for _context_class in CONTEXT_CLASSES:
+    _context_class._visit_name = "visit" + _context_class.__name__[:-len("Context")]
+
+# Token typen for 'list' nøgleordet, som afgør om en initialization er en liste
+LIST_TOKEN: int = penguinParser.literalNames.index("'list'")
+
+# Talsystem for hver heltals literal token type (int() accepterer selv 0x og 0b præfikserne)
+LITERAL_BASES: Dict[int, int] = {
+    penguinParser.DECIMAL: 10,
+    penguinParser.HEX: 16,
+    penguinParser.BINARY: 2,
+}
+
+
 class ASTGenerator(penguinVisitor):
     """Converts an ANTLR parse tree into an AST.
     
@@ -59,6 +80,28 @@ class ASTGenerator(penguinVisitor):
         penguinVisitor (class): The ANTLR visitor class for the Penguin language.
     """
     
+    def __init__(self) -> None:
+        super().__init__()
+        
+        # Context klasse -> visit funktion fra klassen (ikke bundet), så visit() kun laver ét dict opslag
+        # pr. node og ikke skal oprette en bundet metode hver gang
+        generator_class = type(self)
+        self._dispatch: Dict[type, Callable[[ASTGenerator, Any], Any]] = {
+            cls: getattr(generator_class, cls._visit_name) for cls in CONTEXT_CLASSES
+        }
+    
+    def visit(self, tree: Any) -> Any:
+        """Dispatches straight to the visit method of the tree's context class.
+        
+        Falls back to ANTLR's accept() for nodes without a handler, e.g. terminal nodes.
+        """
+        
+        handler = self._dispatch.get(type(tree))
+        if handler is None:
+            return tree.accept(self)
+        
+        return handler(self, tree)
+    
     """Program"""
     
     def visitProgram(self, context: penguinParser.ProgramContext) -> Program:
@@ -71,10 +114,7 @@ class ASTGenerator(penguinVisitor):
         # Visit each statement in the program context
         statements: List[ASTNode] = self.statementsToASTNodes(context.statement())
         
-        # Assert that all statements are ASTNodes
-        assert all(isinstance(stmt, ASTNode) for stmt in statements), "Not all statements in the block are ASTNodes" + "\n" + str(statements)
-        
-        logger.debug(f"Program contains {len(statements)} statements")
+        logger.debug("Program contains %s statements", len(statements))
         
         return Program(statements)
     
@@ -83,90 +123,97 @@ class ASTGenerator(penguinVisitor):
         
         logger.info("Visiting list of statements.")
         
-        visited_statements: List[ASTNode] = [self.visit(stmt) for stmt in statements]
+        visited_statements: List[ASTNode] = list(map(self.visit, statements))
         
-        assert all(isinstance(stmt, ASTNode) for stmt in visited_statements), "Not all statements are ASTNodes" + "\n" + str(visited_statements)
-        logger.debug(f"Visited statements: {visited_statements}")
+        logger.debug("Visited statements: %s", visited_statements)
         
         return visited_statements
     
     """Statements"""
     
+    def visitStatement(self, context: penguinParser.StatementContext) -> ASTNode:
+        """Visits the single child of a statement (declaration, assignment, loop osv.).
+        
+        Uden denne ville ANTLR's visitChildren samle resultatet via aggregateResult for hver statement.
+        """
+        
+        return self.visit(context.getChild(0))
+    
     def visitDeclaration(self, context: penguinParser.DeclarationContext) -> Declaration:
         """Visits the declaration context and creates a Declaration AST node.
         
         Visit declaration and create a Declaration AST node.
         """
         
-        logger.info(f"Visiting declaration: {context.getText()}")
-        
-        # Læg mærke til at for context.NOGET er noget havd det hedder i vores grammar regler!
-        type_: str = context.type_().getText() # getText() returns token string
-        name: str = context.name().getText()
+        logger.info("Visiting declaration at line %s", context.start.line)
         
-        assert type_ and name, "Declaration missing type or name"
+        # declaration: type name ';' - børnene har fast position, så de hentes direkte
+        # i stedet for at lade context.type_() og context.name() søge gennem børnene
+        children = context.children
+        # Navne og typer gentages gennem programmet, så de interneres og deler ét str objekt
+        type_: str = sys.intern(children[0].getText()) # getText() returns token string
+        name: str = sys.intern(children[1].getText())
         
-        logger.debug(f"Declared variable: {name} of type {type_}")
+        logger.debug("Declared variable: %s of type %s", name, type_)
         
         return Declaration(type_, name)
     
     def visitAssignment(self, context: penguinParser.AssignmentContext) -> Assignment:
         """ Visits the assignment context and creates an Assignment AST node."""
         
-        logger.info(f"Visiting assignment: {context.getText()}")
+        logger.info("Visiting assignment at line %s", context.start.line)
         
         # Tjek om context navn findes for at vide om det er en list assignment 
         # eller en normal assignment - Altså, hvilken regl skal der følges
-        if context.name():
+        name_context = context.name()
+        if name_context:
             # Hvis det er en normal assignment
-            target = self.visit(context.name())
-            logger.debug(f"Assignment target: {target}")
+            target = self.visitName(name_context)
+            logger.debug("Assignment target: %s", target)
         else:
             # Hvis det er en list assignment
-            target = self.visit(context.list_access())
-            logger.debug(f"Assignment target list: {target}")
+            target = self.visitListAccess(context.listAccess())
+            logger.debug("Assignment target list: %s", target)
         
         # Besøg værdien af assignmenten
-        value = self.visit(context.expression())
+        value = self.visitExpression(context.expression())
         
-        assert target and value, "Assignment missing target or value"
+        logger.debug("Assigment value: %s, target: %s", value, target)
         
-        logger.debug(f"Assigment value: {value}, target: {target}")
-        
-        return Assignment(target=target, value=value)
+        return Assignment(target, value)
 
     def visitInitialization(self, context: penguinParser.InitializationContext) -> Union[Initialization, ListInitialization]:
         """Visits the initialization context and creates an Initialization or ListInitialization AST node."""
         
-        logger.info(f"Visiting initialization: {context.getText()}")
+        logger.info("Visiting initialization at line %s", context.start.line)
         
-        # Tjek typen af initializeren er en liste eller en normal
-        if context.type_():
-            logger.debug("Normal initialization")
-            
-            # Hvis det er en normal initialization
-            type_: str = context.type_().getText()
-            name: str = context.name().getText()
-            value: str = self.visit(context.expression())
-            
-            assert type_ and name and value, "Initialization missing type, name or value"
-            logger.debug(f"Initialization type: {type_}, name: {name}, value: {value}")
-            
-            return Initialization(type_, name, value)
+        # Første token afgør reglen, så der skal ikke søges i børnene efter type_() eller LBRACK()
+        # type name '=' expression ';'  eller  'list' name '=' LBRACK expressions RBRACK ';'
+        children = context.children
         
-        elif context.LBRACK():
-            # Check for "[" - navnet efter lexerens reglsæt 
+        if context.start.type == LIST_TOKEN:
             # Hvis det er liste initialization
             logger.debug("List initialization")
             
-            name: str = context.name().getText()
-            values: list[ASTNode] = self.visitExpressions(context.expressions()) # list of expressions be like ~(_8^(I)
+            name: str = sys.intern(children[1].getText())
+            values: list[ASTNode] = self.visitExpressions(children[4]) # list of expressions be like ~(_8^(I)
             
-            assert name and values, "List initialization missing name or values"
-            logger.debug(f"List initialization name: {name}, values: {values}")
+            logger.debug("List initialization name: %s, values: %s", name, values)
             
             return ListInitialization(name, values)
         
+        elif isinstance(children[0], penguinParser.TypeContext):
+            logger.debug("Normal initialization")
+            
+            # Hvis det er en normal initialization
+            type_: str = sys.intern(children[0].getText())
+            name: str = sys.intern(children[1].getText())
+            value: str = self.visitExpression(children[3])
+            
+            logger.debug("Initialization type: %s, name: %s, value: %s", type_, name, value)
+            
+            return Initialization(type_, name, value)
+        
         else:
             logger.error("Unknown initialization type encountered")
             raise UnknowninitializationTypeError("Unknown initialization type encountered")
@@ -174,23 +221,16 @@ class ASTGenerator(penguinVisitor):
     def visitConditionalStatement(self, context: penguinParser.ConditionalStatementContext) -> Conditional:
         """Visits the conditional statement context and creates a Conditional AST node."""
         
-        logger.info(f"Visiting conditional statement: {context.getText()}")
+        logger.info("Visiting conditional statement at line %s", context.start.line)
         
-        condition: ASTNode = self.visit(context.expression()) # condition er den eneste expression
-        then_stmts: List[ASTNode] = self.visit(context.statementBlock()) # første block
+        condition: ASTNode = self.visitExpression(context.expression()) # condition er den eneste expression
+        then_stmts: List[ASTNode] = self.visitStatementBlock(context.statementBlock()) # første block
         
-        assert condition and then_stmts, "Conditional statement missing condition or statements"
+        assert then_stmts, "Conditional statement missing statements"
         
         # Hvis der er en else statement skal den også besøges
-        else_stmts: List[ASTNode] = None
-        if context.conditionalStatementElse():
-            else_stmts: List[ASTNode] = self.visit(context.conditionalStatementElse())
-            
-            assert else_stmts, "Conditional statement else missing statements"
-            logger.debug(f"Conditional statement else: {else_stmts}")
-            
-        assert condition and then_stmts, "Conditional statement missing condition or statements"
-        logger.debug(f"Conditional statement condition: {condition}, then statements: {then_stmts}, else statements: {else_stmts}")
+        else_context = context.conditionalStatementElse()
+        else_stmts: Optional[List[ASTNode]] = self.visitConditionalStatementElse(else_context) if else_context else None
         
         return Conditional(condition, then_stmts, else_stmts)
     
@@ -198,91 +238,68 @@ class ASTGenerator(penguinVisitor):
         """Visit the else part of the conditional statement."""
         
         # Kan være det bare skal være del af conditional statement, da de bergge retuyreene conditional
-        logger.info(f"Visiting conditional statement else: {context.getText()}")
+        logger.info("Visiting conditional statement else at line %s", context.start.line)
         
-        statements: List[ASTNode] = self.visit(context.statementBlock())
+        statements: List[ASTNode] = self.visitStatementBlock(context.statementBlock())
 
         assert statements, "Conditional statement else missing statements"
-        logger.debug(f"Conditional statement else statements: {statements}")
+        logger.debug("Conditional statement else statements: %s", statements)
         
         return statements
     
     def visitLoop(self, context: penguinParser.LoopContext) -> Loop:
         """Visits the loop context and creates a Loop AST node."""
         
-        logger.info(f"Visiting loop: {context.getText()}")
+        logger.info("Visiting loop at line %s", context.start.line)
         
-        condition: ASTNode = self.visit(context.expression())
-        statements: List[ASTNode] = self.visit(context.statementBlock())
+        condition: ASTNode = self.visitExpression(context.expression())
+        statements: List[ASTNode] = self.visitStatementBlock(context.statementBlock())
         
-        assert condition and statements, "Loop missing condition or statements"
-        assert all(isinstance(stmt, ASTNode) for stmt in statements), "Not all statements are ASTNodes"
-        logger.debug(f"Loop condition: {condition}, statements: {statements}")
+        assert statements, "Loop missing statements"
+        logger.debug("Loop condition: %s, statements: %s", condition, statements)
         
         return Loop(condition, statements)
     
     def visitProcedureDeclaration(self, context: penguinParser.ProcedureDeclarationContext) -> ProcedureDef:
         """Visits the procedure declaration context and creates a ProcedureDef AST node."""
         
-        logger.info(f"Visiting procedure declaration: {context.getText()}")
+        logger.info("Visiting procedure declaration at line %s", context.start.line)
         
         # Retuern type can være helt tom
-        return_type: str = context.type_().getText() if context.type_() else "void"
-        name: str = context.IDENTIFIER().getText()
+        type_context = context.type_()
+        return_type: str = sys.intern(type_context.getText()) if type_context else "void"
+        name: str = sys.intern(context.IDENTIFIER().getText())
         
-        assert return_type and name, "Procedure declaration missing return type or name"
+        # visitParameterList giver allerede Declaration noder, så de bruges direkte
+        parameter_context = context.parameterList()
+        parametres: List[Declaration] = self.visitParameterList(parameter_context) if parameter_context else []
         
-        parametres: List[Tuple[str, str]] = []
-        if context.parameterList():
-            logger.debug("Procedure declaration has parameters")
-            
-            parametres_raw = self.visitParameterList(context.parameterList())
-            assert parametres_raw, "Procedure declaration missing parameters"
-            
-            parametres = parametres_raw
-            
-            """ for i in range(len(parametres_raw)):
-                logger.debug(f"Visiting parameter {i}: {parametres_raw[i].name}")
-                
-                parametre_type_: str = parametres_raw[i].var_type
-                parametre_name: str = parametres_raw[i].name # IDENTIFIER fordi procedure calls can ikek have dot notation eller liste ting
-                # TODO vær sikekr på at IDENTIFIER har getText()
-                
-                assert parametre_type_ and parametre_name, "Procedure declaration missing parameter type or name"
-                
-                parametres.append((parametre_type_, parametre_name))
-            
-            assert parametres, "Procedure declaration missing parameters" """
-            logger.debug(f"Procedure declaration parameters: {parametres}")
-            
-        statements: List[ASTNode] = self.visit(context.statementBlock())
+        statements: List[ASTNode] = self.visitStatementBlock(context.statementBlock())
         
         assert statements, "Procedure declaration missing statements"
-        logger.debug(f"Procedure declaration return type: {return_type}, name: {name}, parameters: {parametres}, statements: {statements}")
+        logger.debug("Procedure declaration return type: %s, name: %s, parameters: %s, statements: %s", return_type, name, parametres, statements)
         
         return ProcedureDef(return_type, name, parametres, statements)
     
     def visitReturnStatement(self, context: penguinParser.ReturnStatementContext) -> Return:
         """Visits the return statement context and creates a Return AST node."""
         
-        logger.info(f"Visiting return statement: {context.getText()}")
+        logger.info("Visiting return statement at line %s", context.start.line)
         
-        value = self.visit(context.expression())
+        value = self.visitExpression(context.expression())
         
-        assert value, "Return statement missing value"
-        logger.debug(f"Return statement value: {value}")
+        logger.debug("Return statement value: %s", value)
         
         return Return(value)
     
     def visitProcedureCallStatement(self, context: penguinParser.ProcedureCallStatementContext) -> ProcedureCallStatement:
         """Visit the procedure call statement context and creates a ProcedureCallStatement AST node."""
         
-        logger.info(f"Visiting procedure call statement: {context.getText()}")
+        logger.info("Visiting procedure call statement at line %s", context.start.line)
         
-        call: ProcedureCall = self.visit(context.procedureCall())
+        call: ProcedureCall = self.visitProcedureCall(context.procedureCall())
         
-        assert isinstance(call, ProcedureCall), "Procedure call statement missing procedure call"
-        logger.debug(f"Procedure call statement: {call}")
+        logger.debug("Procedure call statement: %s", call)
         
         return ProcedureCallStatement(call)
     
@@ -304,41 +321,73 @@ class ASTGenerator(penguinVisitor):
             BinaryOp | UnaryOp | ASTNode
         """
         
-        logger.info(f"Visiting expression: {context.getText()}")
+        # Operator kæder som a + b + c + ... er dybt venstre-nestede, så i stedet for at rekursere
+        # pr. operator bruges en eksplicit stak. Hvert element er (context, children_done):
+        # første gang lægges operatoren tilbage med children_done=True over sine operander,
+        # og når operanderne er færdige ligger deres AST noder øverst i results.
+        results: List[ASTNode] = []
+        work: List[Tuple[penguinParser.ExpressionContext, bool]] = [(context, False)]
         
-        # For the uninisiated, så er match i python switch i andre sprog. behøver ikke break
-        match context.getChildCount():
-            case 1:
-                # Fidne om det er en værdi, expression osv.
-                logger.debug("Expression has 1 child")
-                return self.visit(context.expr_val())
+        while work:
+            current, children_done = work.pop()
+            children = current.children
             
-            case 2:
-                logger.debug("Expression has 2 childen i.e. UnaryOp")
+            # For the uninisiated, så er match i python switch i andre sprog. behøver ikke break
+            match len(children):
+                case 1:
+                    # Fidne om det er en værdi, expression osv.
+                    logger.info("Visiting expression at line %s", current.start.line)
+                    logger.debug("Expression has 1 child")
+                    
+                    # expr_val foldes ind her: i stedet for at visitExpr_val prøver literal(), name() osv.
+                    # efter tur, afgør typen af dets første barn handleren via dispatch tabellen
+                    value_children = children[0].children
+                    
+                    if len(value_children) == 3:
+                        # LPAREN expression RPAREN - den indre expression lægges på stakken som alle andre
+                        work.append((value_children[1], False))
+                    else:
+                        value_context = value_children[0]
+                        results.append(self._dispatch[type(value_context)](self, value_context))
                 
-                op = context.getChild(0).getText()
-                right = self.visit(context.expression(0)) # first expression child
+                case 2 if not children_done:
+                    logger.info("Visiting expression at line %s", current.start.line)
+                    work.append((current, True))
+                    work.append((children[1], False))
                 
-                assert op and right, "UnaryOp missing operator or right child"
-                logger.debug(f"UnaryOp operator: {op}, right: {right}")
-                
-                return UnaryOp(op, right)
-            
-            case 3:
-                logger.debug("Expression has 3 children i.e. BinaryOp")
+                case 2:
+                    logger.debug("Expression has 2 childen i.e. UnaryOp")
+                    
+                    op = children[0].getText()
+                    right = results.pop()
+                    
+                    logger.debug("UnaryOp operator: %s, right: %s", op, right)
+                    results.append(UnaryOp(op, right))
                 
-                left = self.visit(context.expression(0)) # index 0 because it is the first child
-                op = context.getChild(1).getText() # operator is the second child
-                right = self.visit(context.expression(1)) # index 1 because it is the second child
+                case 3 if not children_done:
+                    logger.info("Visiting expression at line %s", current.start.line)
+                    
+                    # Højre lægges først på stakken, så venstre side besøges først
+                    work.append((current, True))
+                    work.append((children[2], False))
+                    work.append((children[0], False))
                 
-                assert left and op and right, "BinaryOp missing left, operator or right child"
-                logger.debug(f"BinaryOp left: {left}, operator: {op}, right: {right}")
+                case 3:
+                    logger.debug("Expression has 3 children i.e. BinaryOp")
+                    
+                    right = results.pop()
+                    left = results.pop()
+                    op = children[1].getText() # operator is the second child
+                    
+                    logger.debug("BinaryOp left: %s, operator: %s, right: %s", left, op, right)
+                    results.append(BinaryOp(left, op, right))
                 
-                return BinaryOp(left, op, right)      
+                case _:
+                    # Something be wrong in these woods
+                    logger.error("Unknown expression type")
+                    raise UnknownExpressionTypeError(f"Unknown expression type from {current.getText()}")
         
-        # Something be wrong in these woods
-        logger.error("Unknown expression type")
-        raise UnknownExpressionTypeError(f"Unknown expression type from {context.getText()}")
+        return results[0]
     
     def visitExpr_val(self, context: penguinParser.Expr_valContext) -> ASTNode:
         """Visits the expr_val context and creates an AST node.
@@ -357,28 +406,27 @@ class ASTGenerator(penguinVisitor):
         """
         # Can probably be incorporated in where it is implemented
         # Can også være dejligt med clean sepration
-        logger.info(f"Visiting expr_val: {context.getText()}")
+        logger.info("Visiting expr_val at line %s", context.start.line)
         
         # vi prøver at finde ud af havd det nu er vi leger med, og så håndtere en anden funktion det derfra
-        if context.literal():
+        # Hver accessor søger gennem børnene, så resultatet gemmes med := i stedet for at slå op to gange
+        if child := context.literal():
             logger.debug("Visiting literal in expr_val")
-            return self.visit(context.literal())
-        elif context.name():
+            return self.visitLiteral(child)
+        elif child := context.name():
             logger.debug("Visiting name in expr_val")
-            return self.visit(context.name())
-        elif context.procedureCall():
+            return self.visitName(child)
+        elif child := context.procedureCall():
             logger.debug("Visiting procedure call in expr_val")
-            return self.visit(context.procedureCall())
-        elif context.listAccess():
+            return self.visitProcedureCall(child)
+        elif child := context.listAccess():
             logger.debug("Visiting list access in expr_val")
-            return self.visit(context.listAccess())
-        elif context.attributeAccess():
-            logger.debug("Visiting attribute access in expr_val")
-            return self.visit(context.attributeAccess())
-        elif context.expression():
+            return self.visitListAccess(child)
+        # attributeAccess er allerede dækket af name, da name selv parser '.' kæder i visitName
+        elif child := context.expression():
             logger.debug("Visiting expression in expr_val, - paran?")
             # Paranteser? nææ det er bare en expression som barn
-            return self.visit(context.expression())
+            return self.visitExpression(child)
         
         # Can you small that? Rain is coming, pack up the picnic basket
         logger.error("Unknown expr_val type")      
@@ -392,133 +440,107 @@ class ASTGenerator(penguinVisitor):
         
         kig i visitLiteral classen i genereret antlr-py code for at finde ud af hvad der sker
         """
-        logger.info(f"Visiting literal: {context.getText()}")
-        
-        if context.DECIMAL():
-            value = int(context.DECIMAL().getText())
-            assert value is not None, "Integer literal is None"
-            logger.debug(f"Integer literal: {value}")
-            return IntegerLiteral(value)
-        elif context.HEX():
-            value = int(context.HEX().getText(), 16) # convert to int from binary
-            assert value is not None, "Hex literal is None"
-            logger.debug(f"Hex literal: {value}")
-            return IntegerLiteral(value)
-        elif context.BINARY():
-            value = int(context.BINARY().getText(), 2) # convert to int from binary
-            assert value is not None, "Binary literal is None"
-            logger.debug(f"Binary literal: {value}")
-            return IntegerLiteral(value)
-        elif context.STRING():
-            value = context.STRING().getText()
-            assert value is not None, "String literal is None"
-            logger.debug(f"String literal: {value}")
-            return StringLiteral(value)
+        logger.info("Visiting literal at line %s", context.start.line)
+        
+        # literal har præcis ét token som barn, og dets token type afgør talsystemet
+        symbol = context.children[0].symbol
+        logger.debug("Literal: %s", symbol.text)
+        
+        base = LITERAL_BASES.get(symbol.type)
+        
+        if base is not None:
+            return IntegerLiteral(int(symbol.text, base))
+        elif symbol.type == penguinParser.STRING:
+            return StringLiteral(symbol.text)
         
         logger.error("Unknown literal type")
         raise UnknownLiteralTypeError(f"Unknown literal type from {context.getText()}")
     
     def visitName(self, context: penguinParser.NameContext) -> Union[AttributeAccess, Variable, ListAccess]:
         """Visits the name context and creates a Variable, AttributeAccess, or ListAccess AST node."""
-        logger.info(f"Visiting name: {context.getText()}")
-        assert context.IDENTIFIER(), "Name node has no identifiers"
+        logger.info("Visiting name at line %s", context.start.line)
+        
+        # name: IDENTIFIER ('.' IDENTIFIER | '[' expression ']')*
+        # Børnene gennemløbes én gang, og på hinanden følgende indekser samles i én ListAccess
+        children = context.children
+        child_count = len(children)
+        
+        assert child_count, "Name node has no identifiers"
         
         # Start with the base variable
-        current_node = Variable(None, context.IDENTIFIER(0).getText())
-        logger.debug(f"Base variable: {current_node}")
+        current_node = Variable(None, sys.intern(children[0].getText()))
+        logger.debug("Base variable: %s", current_node)
         
-        # Parse the context to build up the access chain
-        i = 1  # Start from the first token after the initial identifier
+        # Langt de fleste navne er en enkelt identifier, så kæde løkken springes helt over
+        if child_count == 1:
+            return current_node
         
-        # Count how many expressions we've processed
-        expression_idx = 0
-        identifier_idx = 1  # Skip the first identifier which was already processed
+        indices: List[ASTNode] = []
+        i = 1  # Start from the first token after the initial identifier
         
-        while i < len(context.children):
-            child = context.children[i]
-            token_text = child.getText()
-            
-            if token_text == '.':
-                # Attribute access: get the next identifier
-                if identifier_idx < len(context.IDENTIFIER()):
-                    attr_name = context.IDENTIFIER(identifier_idx).getText()
-                    current_node = AttributeAccess(current_node, attr_name)
-                    logger.debug(f"Created AttributeAccess: {current_node}")
-                    identifier_idx += 1
-                i += 2  # Skip the '.' and the identifier
-            
-            elif token_text == '[':
-                # List access: collect all consecutive indices
-                indices = []
+        while i < child_count:
+            if children[i].getText() == '.':
+                # Afslut en ventende liste adgang før attributten
+                if indices:
+                    current_node = ListAccess(current_node, indices)
+                    logger.debug("Created ListAccess with indices: %s", current_node)
+                    indices = []
                 
-                # Process this index
-                if expression_idx < len(context.expression()):
-                    index_expr = self.visit(context.expression(expression_idx))
-                    indices.append(index_expr)
-                    expression_idx += 1
-                
-                i += 3  # Skip '[', expression, and ']'
-                
-                # Look ahead for consecutive list accesses to flatten
-                while i < len(context.children) and context.children[i].getText() == '[':
-                    if expression_idx < len(context.expression()):
-                        index_expr = self.visit(context.expression(expression_idx))
-                        indices.append(index_expr)
-                        expression_idx += 1
-                    i += 3  # Skip '[', expression, and ']'
-                
-                # Create a single ListAccess with all the indices
-                current_node = ListAccess(current_node, indices)
-                logger.debug(f"Created ListAccess with indices: {current_node}")
+                current_node = AttributeAccess(current_node, sys.intern(children[i + 1].getText()))
+                logger.debug("Created AttributeAccess: %s", current_node)
+                i += 2  # Skip the '.' and the identifier
             
             else:
-                # Skip any other tokens
-                i += 1
+                indices.append(self.visitExpression(children[i + 1]))
+                i += 3  # Skip '[', expression, and ']'
+        
+        if indices:
+            current_node = ListAccess(current_node, indices)
+            logger.debug("Created ListAccess with indices: %s", current_node)
         
         return current_node
     
     def visitListAccess(self, context: penguinParser.ListAccessContext) -> ListAccess:
         """visit the list access context and creates a ListAccess AST node with flattened indices."""
-        logger.info(f"Visiting list access: {context.getText()}")
+        logger.info("Visiting list access at line %s", context.start.line)
         
-        name = self.visit(context.name())
+        name = self.visitName(context.name())
         current_indices: List[ASTNode] = self.visitExpressions(context.expressions())
         
-        assert name and current_indices, "List access missing name or indices"
+        assert current_indices, "List access missing indices"
         
         if isinstance(name, ListAccess):
             base_name = name.name
             all_indices = name.indices + current_indices
-            logger.debug(f"Flattened list access name: {base_name}, indices: {all_indices}")
+            logger.debug("Flattened list access name: %s, indices: %s", base_name, all_indices)
             return ListAccess(base_name, all_indices)
         else:
-            logger.debug(f"List access name: {name}, indices: {current_indices}")
+            logger.debug("List access name: %s, indices: %s", name, current_indices)
             return ListAccess(name, current_indices)
     
     def visitAttributeAccess(self, context: penguinParser.AttributeAccessContext) -> AttributeAccess:
         """Visit the attribute access context and creates an AttributeAccess AST node."""
         
-        logger.info(f"Visiting attribute access: {context.getText()}")
+        logger.info("Visiting attribute access at line %s", context.start.line)
         
-        name: ASTNode = self.visit(context.name())
-        attribute: str = self.IDENTIFIER().getToken() # TODO tror der er fejl
+        # name er altid en NameContext, så vi kalder visitName direkte
+        name: ASTNode = self.visitName(context.name())
+        attribute: str = sys.intern(context.IDENTIFIER().getText())
         
-        assert name and attribute, "Attribute access missing name or attribute"
-        logger.debug(f"Attribute access name: {name}, attribute: {attribute}")
+        logger.debug("Attribute access name: %s, attribute: %s", name, attribute)
         
         return AttributeAccess(name, attribute)
     
     def visitProcedureCall(self, context: penguinParser.ProcedureCallContext) -> ProcedureCall:
         """Visit the procedure call context and creates a ProcedureCall AST node."""
         
-        logger.info(f"Visiting procedure call: {context.getText()}")
-        
-        name: str = self.visit(context.name())
+        logger.info("Visiting procedure call at line %s", context.start.line)
         
-        assert name, "Procedure call missing name"
+        name: str = self.visitName(context.name())
         
         # Ternary: hvis der er argumenter, så besøg dem og lav en liste af dem
-        args: List[ASTNode] = self.visit(context.argumentList()) if context.argumentList() else []
+        argument_context = context.argumentList()
+        args: List[ASTNode] = self.visitArgumentList(argument_context) if argument_context else []
         
         return ProcedureCall(name, args)
     
@@ -530,14 +552,11 @@ class ASTGenerator(penguinVisitor):
     def visitExpressions(self, context: penguinParser.ExpressionsContext) -> list[ASTNode]:
         """Handles the visit to multiple expressions in the CST."""
         
-        logger.info(f"Visiting list of nodes: {context.getText()}")
+        logger.info("Visiting list of nodes at line %s", context.start.line)
         
-        expressions: List[ASTNode] = [self.visit(expr) for expr in context.expression()]
+        expressions: List[ASTNode] = list(map(self.visitExpression, context.expression()))
         
-        # isinstandce tjekker at et objekt X er af typen Y
-        # all generere en liste af bolske værdier ud fra en for in generator
-        assert all(isinstance(expr, ASTNode) for expr in expressions), "Not all expressions are ASTNodes"
-        logger.debug(f"Visited expressions: {expressions}")
+        logger.debug("Visited expressions: %s", expressions)
         
         return expressions
     
@@ -547,7 +566,7 @@ class ASTGenerator(penguinVisitor):
         Skal bruges til at generere AST'en for en procedure declaration
         """
         
-        logger.info(f"Visiting parameter list: {context.getText()}")
+        logger.info("Visiting parameter list at line %s", context.start.line)
         
         # Visit each parameter in the parameter list
         parametres: List[ASTNode] = []
@@ -567,47 +586,52 @@ class ASTGenerator(penguinVisitor):
         output: (('John', 'Jenny'), ('Charles', 'Christy'), ('Mike', 'Monica')) 
         """
 
-        # assert that type and identifier are the same length
-        assert len(context.type_()) == len(context.IDENTIFIER()), "Parameter list type and identifier length mismatch"
+        # parameterList: type IDENTIFIER (',' type IDENTIFIER)*
+        # Børnene gentager sig med en periode på 3, så typer og navne skæres ud af én liste
+        # i stedet for at context.type_() og context.IDENTIFIER() hver søger gennem børnene
+        children = context.children
+        types = children[0::3]
+        identifiers = children[1::3]
         
         # Zip de to lister sammen, så vi kan få fat i type og navn på samme tid
-        for t, i in zip(context.type_(), context.IDENTIFIER()):
+        for t, i in zip(types, identifiers):
             # Besøg type og navn og lav en ny node Variable for hver parameter
-            parametres.append(Declaration(name=i.getText(), var_type=t.getText()))
+            parametres.append(Declaration(sys.intern(t.getText()), sys.intern(i.getText())))
         
-        assert all(isinstance(param, ASTNode) for param in parametres), "Not all parameters are ASTNodes"
-        logger.debug(f"Parameter list: {parametres}")
+        logger.debug("Parameter list: %s", parametres)
         
         return parametres # liste af en typle af to strenge
     
     def visitArgumentList(self, context: penguinParser.ArgumentListContext) -> List[ASTNode]:
         """Visits the argument list context and creates a list of AST nodes."""
         
-        logger.info(f"Visiting argument list: {context.getText()}")
+        logger.info("Visiting argument list at line %s", context.start.line)
         
         # Arguments could could all come in some form of expression
-        arguments: List[ASTNode] = [self.visitExpression(expression) for expression in context.expression()]
+        arguments: List[ASTNode] = list(map(self.visitExpression, context.expression()))
         
-        assert all(isinstance(arg, ASTNode) for arg in arguments), "Not all arguments are ASTNodes" + "\n" + str(arguments)
-        logger.debug(f"Argument list: {arguments}")
+        logger.debug("Argument list: %s", arguments)
         
         return arguments
     
     def visitType(self, context: penguinParser.TypeContext) -> str:
         # ved ikk endnu om denen overhoved behøves at blvie implementeret
         # men den er der under visitor pattern koden
-        logger.info(f"Visiting type: {context.getText()}")
+        logger.info("Visiting type at line %s", context.start.line)
         return super().visitType(context)
     
+    def visitComment(self, context: penguinParser.CommentContext) -> None:
+        # Kommentarer bliver ikke til AST noder
+        return None
+    
     def visitStatementBlock(self, context: penguinParser.StatementBlockContext) -> List[ASTNode]:
         """Visits a block of statements"""
 
-        logger.info(f"Visiting statement block: {context.getText()}")
+        logger.info("Visiting statement block at line %s", context.start.line)
         
-        statements: List[ASTNode] = [self.visit(statement) for statement in context.statement()]
+        statements: List[ASTNode] = list(map(self.visit, context.statement()))
         
         assert statements, "Statement block missing statements"
-        assert all(isinstance(stmt, ASTNode) for stmt in statements), "Not all statements are ASTNodes" + "\n" + str(statements)
-        logger.debug(f"Statement block: {statements}")
+        logger.debug("Statement block: %s", statements)
         
         return statements
@@ -6,7 +6,7 @@ Traverses an AST and verifies type correctness according to language rules.
 # Stdlib imports
 import os
 import sys
-from typing import List, Tuple, Union, Optional, Dict
+from typing import List, Tuple, Union, Optional, Dict, Callable, Set
 
 # Extend module paths
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -43,38 +43,133 @@ from src.logger import logger
 # Typetjek dem imens?
 
 
-class TypeEnv: 
-    # Symbol table for the type checker.
-    def __init__(self):
-        self.stack: List[Dict] = [{}]
+# Type names from the grammar mapped to the shared singleton Type instances from astTypes
+TYPE_TABLE: Dict[str, Type] = {
+    "int": INT,
+    "tileset": TILESET,
+    "tilemap": TILEMAP,
+    "sprite": SPRITE,
+    "string": STRING,
+    "void": VOID,
+    "oamentry": OAM_ENTRY,
+    "list": LIST_INT,
+}
+
+# Operators taken from the grammar, mapped to their category for error messages.
+# The dicts double as the set of known operators.
+BINARY_OPERATOR_CATEGORIES: Dict[str, str] = {
+    '*': "Arithmetic", '+': "Arithmetic", '-': "Arithmetic", '<<': "Arithmetic", '>>': "Arithmetic",
+    '<': "Comparison", '>': "Comparison", '<=': "Comparison", '>=': "Comparison", '==': "Comparison", '!=': "Comparison",
+    '&': "Bitwise", '^': "Bitwise", '|': "Bitwise",
+    'and': "Logical", 'or': "Logical",
+}
+
+UNARY_OPERATOR_CATEGORIES: Dict[str, str] = {
+    '-': "Arithmetic", '+': "Arithmetic",
+    '~': "Bitwise",
+    'not': "Logical",
+}
+
+# Nodes whose name is the next (inner) part of a dotted path
+NAME_CHAIN_CLASSES = frozenset({Variable, ListAccess, ProcedureCall, ProcedureDef})
+
+
+def construct_path(name_path: Union[str, ASTNode]) -> str:
+    """Construct the dotted path of a name, like a.b.c, from a (possibly nested) name node.
+    
+    Walks down the chain of name nodes iteratively and joins the collected segments,
+    instead of recursing and concatenating once per segment.
+    """
+    parts: List[str] = []
+    current = name_path
+    
+    while True:
+        # base case is when the name is a string
+        if isinstance(current, str):
+            parts.append(current)
+            break
+        # AttributeAccess adds its attribute and continues down its name
+        elif type(current) is AttributeAccess:
+            parts.append(current.attribute)
+            current = current.name
+        # Variable, ListAccess, ProcedureCall etc. continue down their name
+        elif type(current) in NAME_CHAIN_CLASSES:
+            current = current.name
+        # if nothing else, use the string representation of the node
+        else:
+            parts.append(str(current))
+            break
+    
+    # segments are collected from the outermost attribute inwards
+    return ".".join(reversed(parts))
+
 
-    def push(self):
-        self.stack.append({})
+def literal_check(literal_class: type, literal_type: Type) -> Callable[["TypeChecker", ASTNode], Type]:
+    """Generate the check method for a literal node class whose type is always literal_type.
+    
+    The generated method only stores and returns the type, with no dispatch or logging.
+    """
+    def check(self: "TypeChecker", node: ASTNode) -> Type:
+        node.var_type = literal_type  # Store the type in the node for later use
+        return literal_type
+    
+    check.__name__ = f"check_{literal_class.__name__}"
+    check.__qualname__ = f"TypeChecker.check_{literal_class.__name__}"
+    check.__doc__ = f"Type check a {literal_class.__name__} node."
+    return check
 
-    def pop(self):
-        self.stack.pop()
 
-    def define(self, name, typ):
-        self.stack[-1][name] = typ
+class TypeEnv: 
+    # Symbol table for the type checker.
+    # One flat dict maps each name to a stack of its shadowed types, innermost last,
+    # and scope_names records which names each scope introduced so pop can undo them.
+    __slots__ = ('symbols', 'scope_names')
+    
+    def __init__(self) -> None:
+        self.symbols: Dict[str, List[Type]] = {}
+        self.scope_names: List[Set[str]] = [set()]
+
+    def push(self) -> None:
+        self.scope_names.append(set())
+
+    def pop(self) -> None:
+        for name in self.scope_names.pop():
+            types = self.symbols[name]
+            types.pop()
+            if not types:
+                del self.symbols[name]
+
+    def define(self, name: str, typ: Type) -> None:
+        scope = self.scope_names[-1]
+        if name in scope:
+            # Redefining in the same scope replaces the innermost type
+            self.symbols[name][-1] = typ
+        else:
+            self.symbols.setdefault(name, []).append(typ)
+            scope.add(name)
 
     def lookup(self, name: str) -> Optional[Type]:
-        for scope in reversed(self.stack):  # Check inner to outer
-            if name in scope:
-                return scope[name]
-        return None
+        types = self.symbols.get(name)
+        return types[-1] if types else None
+
+    def in_current_scope(self, name: str) -> bool:
+        return name in self.scope_names[-1]
 
-    def current_scope(self):
-        return self.stack[-1]
+    def current_scope(self) -> Dict[str, Type]:
+        return {name: self.symbols[name][-1] for name in self.scope_names[-1]}
 
 
 class ProcedureEnv:
-    def __init__(self):
-        self.table: Dict[str, Tuple[List[Tuple[str, Type]], Type]] = {}
+    __slots__ = ('table',)
+    
+    def __init__(self) -> None:
+        self.table: Dict[str, Tuple[List[Tuple[str, Type]], Tuple[Type, ...], Type]] = {}
 
-    def define(self, name: str, params: List[Tuple[str, Type]], return_type: Type):
-        self.table[name] = (params, return_type)
+    def define(self, name: str, params: List[Tuple[str, Type]], return_type: Type) -> None:
+        # the parameter types are also stored on their own, so calls don't unpack the (name, type) pairs
+        self.table[name] = (params, tuple(param_type for _, param_type in params), return_type)
 
-    def lookup(self, name: str) -> Optional[Tuple[List[Tuple[str, Type]], Type]]:
+    def lookup(self, name: str) -> Optional[Tuple[List[Tuple[str, Type]], Tuple[Type, ...], Type]]:
         return self.table.get(name)
 
 
@@ -84,82 +179,74 @@ class TypeChecker:
     Traverses an AST and verifies type and scope correctness according to language rules.
     """
     
-    def __init__(self):
+    __slots__ = ('env', 'procedures', 'current_return_type', '_work_stack', '_dispatch', '_registered_procedures')
+    
+    # Predefined hardware symbols and procedure table entries, built on first use and shared by all type checkers
+    _hardware_tables: Optional[Tuple[Dict[str, Type], Dict[str, Tuple[List[Tuple[str, Type]], Tuple[Type, ...], Type]]]] = None
+    
+    def __init__(self) -> None:
         
         self.env = TypeEnv() # Symbol table
         self.procedures = ProcedureEnv() # Procedure table
         self.current_return_type: Optional[Type] = None  # Return type of the current procedure
+        self._work_stack: Optional[List[Union[ASTNode, Callable[[], None]]]] = None  # Statement stack of the running check_statements
+        self._registered_procedures: Set[ProcedureDef] = set()  # Procedures whose signature is already in the procedure table
+        
+        # Dispatch table from AST class to its check method, built once instead of per node
+        self._dispatch: Dict[type, Callable[[ASTNode], Optional[Type]]] = {Program: self.check_program}
+        for cls in (Declaration, Assignment, Initialization, ListInitialization, Conditional, Loop, Return,
+                    BinaryOp, UnaryOp, IntegerLiteral, StringLiteral, Variable, ListAccess, AttributeAccess,
+                    ProcedureCallStatement, ProcedureCall, ProcedureDef):
+            self._dispatch[cls] = getattr(self, f"check_{cls.__name__}")
         
         # Initialize predefined hardware elements
         self._init_predefined_elements()
     
-    def _init_predefined_elements(self):
+    def _init_predefined_elements(self) -> None:
         """Initialize predefined hardware modules, variables, and functions."""
-        # Get predefined elements from the hardware module
-        hardware_symbols, hardware_procedures = initialize_hardware_elements()
+        if TypeChecker._hardware_tables is None:
+            # Get predefined elements from the hardware module, and build their procedure table entries once
+            hardware_symbols, predefined_procedures = initialize_hardware_elements()
+            hardware_procedures = ProcedureEnv()
+            for name, (params, ret_type) in predefined_procedures.items():
+                hardware_procedures.define(name, params, ret_type)
+            TypeChecker._hardware_tables = (hardware_symbols, hardware_procedures.table)
+        
+        hardware_symbols, hardware_procedures = TypeChecker._hardware_tables
         
         # add to symboltable (env)
         for symbol, typ in hardware_symbols.items():
             self.env.define(symbol, typ)
         
-        # Add procedures to the procedure table
-        for name, (params, ret_type) in hardware_procedures.items():
-            self.procedures.define(name, params, ret_type)
+        # Add procedures to the procedure table, the entries are never modified so they can be shared
+        self.procedures.table.update(hardware_procedures)
         
-        logger.info(f"Initialized {len(hardware_symbols)} hardware symbols and {len(hardware_procedures)} hardware procedures")
+        logger.info("Initialized %s hardware symbols and %s hardware procedures", len(hardware_symbols), len(hardware_procedures))
     
     def string_to_type(self, type_str: str) -> Type:
         """Convert a type string to a Type object."""
-        logger.debug(f"Converting string '{type_str}' to type")
-        
-        dictionary = {
-            "int": IntType(),
-            "tileset": TilesetType(),
-            "tilemap": TileMapType(),
-            "sprite": SpriteType(),
-            "string": StringType(),
-            "void": VoidType(),
-            "oamentry": OAMEntryType(),
-            "list": ListType()
-        }
-        # Check if the type string is in the dictionary
+        logger.debug("Converting string '%s' to type", type_str)
+        
+        # Check if the type string is in the type table
         type_str = type_str.lower()
-        if type_str in dictionary:
-            return dictionary[type_str]
-        else:
+        typ = TYPE_TABLE.get(type_str)
+        if typ is None:
             # If not, handle the case where the type is not recognized
             logger.error(f"Invalid type: {type_str}")
             raise InvalidTypeError(f"Invalid type: {type_str} --- {type(type_str)}")
         
+        return typ
+        
     def get_procedure_name(self, node: Union[ProcedureCall, ProcedureDef]) -> str:
         # hjælper methodf forr getting qa procedure namer, where the procedure might accessed with an attribute
         
-        # node is usually a Variable or an AttributeAccess (possibly nested)
-        # base case is when node is a string (the name of the procedure)
-        if isinstance(node, str):
-            return node
-        # check if node is an AttributeAccess
-        elif hasattr(node, 'name') and hasattr(node, 'attribute'):
-            # recursively get the base name of each attribute, and add the attribute to the end
-            base = self.get_procedure_name(node.name)
-            return f"{base}.{node.attribute}"
-        # check if node is a Variable
-        elif hasattr(node, 'name'):
-            # return the name of the node, which is the procedure name
-            return self.get_procedure_name(node.name)
-        # check if node is a Variable with a string name
-        elif isinstance(node, Variable) and isinstance(node.name, str):
-            return node.name
-        # if nothign else, return the string representation of the node
-        return str(node)  # fallback
+        # node is usually a Variable or an AttributeAccess (possibly nested), same walk as for attribute paths
+        return construct_path(node)
     
     def check_node(self, node: ASTNode) -> Type:
         """Type check an AST node by dispatching to the appropriate method in the TypeChecker."""
-        logger.debug(f"Type checking node: {type(node).__name__}")
-        
-        # Use a method dispatch pattern to call the appropriate check method
-        method_name = f"check_{node.__class__.__name__}"
-        method = getattr(self, method_name, None)
+        # Look up the check method for the node's class in the dispatch table
+        method = self._dispatch.get(type(node))
         
         if method is None:
             logger.error(f"No type checking method for {type(node).__name__}")
@@ -171,18 +258,60 @@ class TypeChecker:
         """Type check a Program node."""
         logger.info("Type checking program")
         
+        # Register the signatures of the top level procedures first, so they can be called
+        # from anywhere in the program, also before their definition
+        for statement in node.statements:
+            if type(statement) is ProcedureDef:
+                self.register_procedure(statement)
+        
         # Type check each statement in the program
-        for stmt in node.statements:
-            self.check_node(stmt)
+        self.check_statements(node.statements)
     
-    def check_Declaration(self, node: Declaration) -> None:
-        """Type check a Declaration node."""
-        logger.info(f"Type checking declaration: {node.name} of type {node.var_type}")
+    def check_statements(self, statements: List[ASTNode], on_exit: Optional[Callable[[], None]] = None) -> None:
+        """Type check a list of statements through an explicit work stack.
+        
+        Bodies of conditionals, loops and procedures are pushed onto the stack of the
+        driver that is already running instead of being checked recursively, so nested
+        statements do not grow the Python call stack. Operator expressions get the same
+        treatment in check_operators.
+        
+        Args:
+            statements (List[ASTNode]): The statements to check, in order.
+            on_exit (Callable, optional): Run once all of the statements have been checked.
+        """
+        if self._work_stack is not None:
+            # A driver further up is running, schedule the statements on its stack
+            if on_exit is not None:
+                self._work_stack.append(on_exit)
+            self._work_stack.extend(reversed(statements))
+            return
+        
+        # Otherwise this call is the driver, popping statements (and exit actions) until done
+        stack: List[Union[ASTNode, Callable[[], None]]] = [on_exit] if on_exit is not None else []
+        stack.extend(reversed(statements))
+        self._work_stack = stack
+        # bind the stack pop and check_node once, rather than looking them up per statement
+        pop = stack.pop
+        check_node = self.check_node
+        try:
+            while stack:
+                item = pop()
+                if isinstance(item, ASTNode):
+                    check_node(item)
+                else:
+                    item()
+        finally:
+            self._work_stack = None
+    
+    def declare_variable(self, node: Union[Declaration, Initialization]) -> Type:
+        """Define the variable of a Declaration or Initialization node in the current scope.
         
+        Returns:
+            Type: The declared type of the variable, which is also stored on the node.
+        """
         # Check if the variable has already been declared in the current scope
-        if self.env.lookup(node.name) is not None:
-            if node.name in self.env.current_scope():
-                raise DuplicateDeclarationError(f"Variable '{node.name}' already declared in this scope")
+        if self.env.in_current_scope(node.name):
+            raise DuplicateDeclarationError(f"Variable '{node.name}' already declared in this scope")
         
         # Convert the type string to a Type object
         var_type = self.string_to_type(node.var_type)
@@ -192,12 +321,19 @@ class TypeChecker:
         
         # Store type in the node for later use
         node.var_type = var_type
+        return var_type
+    
+    def check_Declaration(self, node: Declaration) -> None:
+        """Type check a Declaration node."""
+        logger.info("Type checking declaration: %s of type %s", node.name, node.var_type)
+        
+        var_type = self.declare_variable(node)
 
-        logger.debug(f"Declared variable '{node.name}' with type {var_type}")
+        logger.debug("Declared variable '%s' with type %s", node.name, var_type)
     
     def check_Assignment(self, node: Assignment) -> None:
         """Type check an Assignment node."""
-        logger.info(f"Type checking assignment: {node.target}")
+        logger.info("Type checking assignment: %s", node.target)
         
         # Type check the target and value
         target_type = self.check_node(node.target)
@@ -207,38 +343,26 @@ class TypeChecker:
         node.var_type = target_type
         
         # Check if the types match
-        if target_type != value_type:   
-            if (value_type == SpriteType() and target_type == IntType()):
+        if target_type is not value_type and target_type != value_type:
+            if (value_type == SPRITE and target_type == INT):
                 return 
             
             logger.error(f"Type mismatch in assignment: expected {target_type}, got {value_type}")
             raise TypeMismatchError(f"Type mismatch in assignment: expected {target_type}, got {value_type}")
         
-        logger.debug(f"Assigned {node.value} to {node.target}")
+        logger.debug("Assigned %s to %s", node.value, node.target)
 
     def check_Initialization(self, node: Initialization) -> None:
         """Type check an Initialization node."""
-        logger.info(f"Type checking initialization: {node.name} of type {node.var_type}")
-        
-        # Check if the variable is already declared in the current scope
-        if self.env.lookup(node.name) is not None:
-            if node.name in self.env.current_scope():
-                raise DuplicateDeclarationError(f"Variable '{node.name}' already declared in this scope")
-        
-        # Convert the type string to a Type object
-        var_type = self.string_to_type(node.var_type)
+        logger.info("Type checking initialization: %s of type %s", node.name, node.var_type)
         
-        # Add the variable to the symbol table
-        self.env.define(node.name, var_type)
+        var_type = self.declare_variable(node)
         
         # Type check the value
         value_type = self.check_node(node.value)
         
-        # Store the type in the node for later use
-        node.var_type = var_type
-        
         # Check if the types match
-        if var_type != value_type:
+        if var_type is not value_type and var_type != value_type:
             # Special case for Tileset, TileMap, and Sprite which must be assigned strings
             if isinstance(var_type, (TilesetType, TileMapType, SpriteType)) and isinstance(value_type, StringType):
                 return
@@ -248,15 +372,14 @@ class TypeChecker:
     
     def check_ListInitialization(self, node: ListInitialization) -> None:
         """Type check a ListInitialization node."""
-        logger.info(f"Type checking list initialization: {node.name}")
+        logger.info("Type checking list initialization: %s", node.name)
         
         # Check if the variable has already been declared in the current scope
-        if self.env.lookup(node.name) is not None:
-            if node.name in self.env.current_scope():
-                raise DuplicateDeclarationError(f"Variable '{node.name}' already declared in this scope")
+        if self.env.in_current_scope(node.name):
+            raise DuplicateDeclarationError(f"Variable '{node.name}' already declared in this scope")
         
         # Per the rules, lists must always be of type int
-        list_type = ListType(IntType())
+        list_type = LIST_INT
         
         # Add the variable to the symbol table
         self.env.define(node.name, list_type)
@@ -266,8 +389,13 @@ class TypeChecker:
         
         # Type check each value in the list
         for value in node.values:
+            # Integer literals are the common case and always int, so skip the dispatch for them
+            if type(value) is IntegerLiteral:
+                value.var_type = INT
+                continue
+            
             value_type = self.check_node(value)
-            if value_type != IntType():
+            if value_type is not INT and value_type != INT:
                 logger.error(f"Type mismatch in list initialization: expected int, got {value_type}")
                 raise TypeMismatchError(f"Type mismatch in list initialization: expected int, got {value_type}")
     
@@ -279,20 +407,14 @@ class TypeChecker:
         condition_type = self.check_node(node.condition)
         
         # Check if the condition evaluates to a boolean (represented as int in this language)
-        if not isinstance(condition_type, IntType):
+        if condition_type is not INT:
             logger.error(f"Condition must be of type int, got {condition_type}")
             raise TypeMismatchError(f"Condition must be of type int, got {condition_type}")
         
-        # Type check the then body
-        for statement in node.then_body:
-            self.check_node(statement)
+        # Type check the then body followed by the else body, which is empty if there is none
+        self.check_statements(node.then_body + node.else_body)
         
-        # Type check the else body if it exists
-        if node.else_body:
-            for statement in node.else_body:
-                self.check_node(statement)
-        
-        return VoidType()
+        return VOID
     
     def check_Loop(self, node: Loop) -> Type:
         """Type check a Loop node."""
@@ -302,15 +424,14 @@ class TypeChecker:
         condition_type = self.check_node(node.condition)
         
         # Check if the condition evaluates to a boolean (represented as int in this language)
-        if not isinstance(condition_type, IntType):
+        if condition_type is not INT:
             logger.error(f"Loop condition must be of type int, got {condition_type}")
             raise TypeMismatchError(f"Loop condition must be of type int, got {condition_type}")
         
         # Type check the body
-        for statement in node.body:
-            self.check_node(statement)
+        self.check_statements(node.body)
         
-        return VoidType()
+        return VOID
     
     def check_Return(self, node: Return) -> Type:
         """Type check a Return node."""
@@ -327,7 +448,7 @@ class TypeChecker:
             logger.error("Return statement outside of procedure")
             raise TypeError("Return statement outside of procedure")
         
-        if value_type != self.current_return_type:
+        if value_type is not self.current_return_type and value_type != self.current_return_type:
             logger.error(f"Return type mismatch: expected {self.current_return_type}, got {value_type}")
             raise TypeMismatchError(f"Return type mismatch: expected {self.current_return_type}, got {value_type}")
     
@@ -340,91 +461,97 @@ class TypeChecker:
     
     def check_BinaryOp(self, node: BinaryOp) -> Type:
         """Type check a BinaryOp node."""
-        logger.info(f"Type checking binary operation: {node.op}")
-        
-        # Type check the left and right operands
-        left_type = self.check_node(node.left)
-        right_type = self.check_node(node.right)
+        return self.check_operators(node)
+    
+    def check_UnaryOp(self, node: UnaryOp) -> Type:
+        """Type check a UnaryOp node."""
+        return self.check_operators(node)
+    
+    def check_operators(self, root: Union[BinaryOp, UnaryOp]) -> Type:
+        """Type check a tree of BinaryOp and UnaryOp nodes in post-order through an explicit stack.
+        
+        Long operator chains like a + b + c + ... nest as deep as they are long, so the
+        operator nodes are walked iteratively and only their other operands, like literals,
+        variables and calls, are checked through check_node.
+        
+        Args:
+            root (Union[BinaryOp, UnaryOp]): The outermost operator node.
+        
+        Returns:
+            Type: The type of the root operation.
+        """
+        check_node = self.check_node
+        operand_types: List[Type] = []
+        stack: List[Tuple[ASTNode, bool]] = [(root, False)]
+        
+        while stack:
+            node, operands_done = stack.pop()
+            node_class = type(node)
+            
+            if node_class is BinaryOp:
+                if operands_done:
+                    right_type = operand_types.pop()
+                    left_type = operand_types.pop()
+                    operand_types.append(self.binary_op_type(node, left_type, right_type))
+                else:
+                    logger.info("Type checking binary operation: %s", node.op)
+                    # the left operand is pushed last, so it is checked first
+                    stack.append((node, True))
+                    stack.append((node.right, False))
+                    stack.append((node.left, False))
+            
+            elif node_class is UnaryOp:
+                if operands_done:
+                    operand_types.append(self.unary_op_type(node, operand_types.pop()))
+                else:
+                    logger.info("Type checking unary operation: %s", node.op)
+                    stack.append((node, True))
+                    stack.append((node.operand, False))
+            
+            else:
+                operand_types.append(check_node(node))
         
-        # Store the type in the node for later use
-        node.var_type = right_type
-        
-        # define sets of operators, taken from grammar
-        complex_artimetic_operators = {'*'}
-        simple_arithmetic_operators = {'+', '-'}
-        bitwise_arthmetic_operators = {'<<', '>>'}
-        x_than_operators = {'<', '>', '<=', '>='}
-        equality_operators = {'==', '!='}
-        bitwise_logical_operators1 = {'&'}
-        bitwise_logical_operators2 = {'^'}
-        bitwise_logical_operators3 = {'|'}
-        logical_operators1 = {'and'}
-        logical_operators2 = {'or'}
-        
-        # Check operator compatibility
-        if node.op in complex_artimetic_operators | simple_arithmetic_operators | bitwise_arthmetic_operators \
-                                                  | x_than_operators | equality_operators | bitwise_logical_operators1 \
-                                                  | bitwise_logical_operators2 | bitwise_logical_operators3 \
-                                                  | logical_operators1 | logical_operators2:
-                
-            if not isinstance(left_type, IntType) or not isinstance(right_type, IntType):
-                operator_type = "Arithmetic" if node.op in complex_artimetic_operators | simple_arithmetic_operators | bitwise_arthmetic_operators else \
-                    "Comparison" if node.op in x_than_operators | equality_operators else \
-                    "Bitwise" if node.op in bitwise_logical_operators1 | bitwise_logical_operators2 | bitwise_logical_operators3 else \
-                    "Logical"
-                logger.error(f"{operator_type} operator '{node.op}' requires integer operands, got {left_type} and {right_type}")
-            return IntType()
+        return operand_types[0]
+    
+    def binary_op_type(self, node: BinaryOp, left_type: Type, right_type: Type) -> Type:
+        """Type of a BinaryOp node whose operands have been checked."""
+        # Check operator compatibility against the operators from the grammar
+        if node.op in BINARY_OPERATOR_CATEGORIES:
+            if left_type is not INT or right_type is not INT:
+                logger.error("%s operator '%s' requires integer operands, got %s and %s", BINARY_OPERATOR_CATEGORIES[node.op], node.op, left_type, right_type)
+            node.var_type = INT  # Store the type in the node for later use
+            return INT
         else:
             logger.error(f"Unknown binary operator: {node.op}")
             raise TypeError(f"Unknown binary operator: {node.op}")
     
-    def check_UnaryOp(self, node: UnaryOp) -> Type:
-        """Type check a UnaryOp node."""
-        logger.info(f"Type checking unary operation: {node.op}")
-        
-        # Type check the operand
-        operand_type = self.check_node(node.operand)
-        
-        # define sets of operators, taken from grammar
-        arithmetic_operators = {'-', '+'}
-        bitwise_operators = {'~'}
-        logical_operators = {'not'}
-        
-        if node.op in arithmetic_operators | bitwise_operators | logical_operators:
-            if not isinstance(operand_type, IntType):
-                operator_type = "Arithmetic" if node.op in arithmetic_operators else \
-                    "Bitwise" if node.op in bitwise_operators else \
-                    "Logical"
-                logger.error(f"{operator_type} operator '{node.op}' requires integer operand, got {operand_type}")
-            node.var_type = IntType()  # Store the type in the node for later use
-            return IntType()
+    def unary_op_type(self, node: UnaryOp, operand_type: Type) -> Type:
+        """Type of a UnaryOp node whose operand has been checked."""
+        # Check operator compatibility against the operators from the grammar
+        if node.op in UNARY_OPERATOR_CATEGORIES:
+            if operand_type is not INT:
+                logger.error("%s operator '%s' requires integer operand, got %s", UNARY_OPERATOR_CATEGORIES[node.op], node.op, operand_type)
+            node.var_type = INT  # Store the type in the node for later use
+            return INT
         
         else:
             logger.error(f"Unknown unary operator: {node.op}")
             raise TypeError(f"Unknown unary operator: {node.op}")
     
-    def check_IntegerLiteral(self, node: IntegerLiteral) -> Type:
-        """Type check an IntegerLiteral node."""
-        logger.debug(f"Integer literal: {node.value}")
-        node.var_type = IntType()  # Store the type in the node for later use
-        return IntType()
-    
-    def check_StringLiteral(self, node: StringLiteral) -> Type:
-        """Type check a StringLiteral node."""
-        logger.debug(f"String literal: {node.value}")
-        node.var_type = StringType()  # Store the type in the node for later use
-        return StringType()
+    # Literals always have the same type, so their check methods are generated
+    check_IntegerLiteral = literal_check(IntegerLiteral, INT)
+    check_StringLiteral = literal_check(StringLiteral, STRING)
     
     def check_Variable(self, node: Variable) -> Type:
         """Type check a Variable node."""
-        logger.info(f"Type checking variable: {node.name}")
+        logger.info("Type checking variable: %s", node.name)
         
         # Handle the case where node.name is an AttributeAccess instance
         if isinstance(node.name, AttributeAccess):
             # When Variable contains an AttributeAccess, we should just check the AttributeAccess
             var_type = self.check_AttributeAccess(node.name)
             node.var_type = var_type
-            return self.check_node(node.name)
+            return var_type
         
         # Regular case - node.name is a string
         # Check if the variable has been declared
@@ -439,19 +566,18 @@ class TypeChecker:
     
     def check_ListAccess(self, node: ListAccess) -> Type:
         """Type check a ListAccess node."""
-        logger.info(f"Type checking list access: {node.name}")
+        logger.info("Type checking list access: %s", node.name)
         
         # Store the type in the node for later use
-        node.var_type = IntType()
+        node.var_type = INT
         
         base_type = None
         
         # Get the base object to check if it's indexable
         if isinstance(node.name, str):
-            try:
-                # Check if the variable has been declared, if not, raise an error, else get its type
-                base_type = self.env.lookup(node.name)
-            except KeyError:
+            # Check if the variable has been declared, if not, raise an error, else get its type
+            base_type = self.env.lookup(node.name)
+            if base_type is None:
                 logger.error(f"Undeclared variable: {node.name}")
                 raise UndeclaredVariableError(f"Undeclared variable: {node.name}")
         else:
@@ -466,7 +592,7 @@ class TypeChecker:
         # Type check each index, ensuring they are of type int
         for index in node.indices:
             index_type = self.check_node(index)
-            if not isinstance(index_type, IntType):
+            if index_type is not INT:
                 logger.error(f"Index must be of type int, got {index_type}")
                 raise TypeMismatchError(f"Index must be of type int, got {index_type}")
         
@@ -478,37 +604,16 @@ class TypeChecker:
         
         # TODO: make less complex
         
-        logger.info(f"Type checking attribute access: {node.attribute} on {node.name}")
-        
-        # Attributes can ahve complex paths, like a.b.c, so we need to handle that
-        # to handle this we make the helper funcion that constructs the path
-        def construct_path(name_path) -> str:
-            # Check if name is a string
-            if isinstance(name_path, str):
-                return name_path
-            # check if name is an AttributeAccess
-            elif isinstance(name_path, AttributeAccess):
-                # recursively construct the path
-                return f"{construct_path(name_path.name)}.{name_path.attribute}"
-            # check if name is a Variable
-            elif hasattr(name_path, 'name'):
-                return f"{name_path.name}.{node.attribute}"
-            # else return the name as string
-            else:
-                return str(name_path)
+        logger.info("Type checking attribute access: %s on %s", node.attribute, node.name)
         
-        # Construct the full path
-        base_name = construct_path(node.name)
-        full_path = f"{base_name}.{node.attribute}"
+        # Attributes can have complex paths, like a.b.c, so construct the full path
+        full_path = construct_path(node)
         
         # Check is it is in the symbol table
-        try:
-            # Check if the variable has been declared
-            var_type = self.env.lookup(full_path)
+        var_type = self.env.lookup(full_path)
+        if var_type is not None:
             return var_type
-        except KeyError:
-            # siden det så ikke er i symbol table, kan man tjekke videre
-            pass
+        # siden det så ikke er i symbol table, kan man tjekke videre
         
         # Get the base object type
         base_obj = self.check_node(node.name) if isinstance(node.name, ASTNode) else self.env.lookup(node.name) # self.symbol_table.get(node.name)
@@ -519,8 +624,8 @@ class TypeChecker:
         
         # Special case for when node.name is a ListAccess
         if isinstance(node.name, ListAccess):
-            # If this is a list access, get the element type from the list type
-            list_type = self.check_node(node.name)
+            # base_obj is already the element type, checked by check_node above, so don't check the list again
+            list_type = base_obj
             
             # If the element type is OAMEntryType, we can access its attributes
             if isinstance(list_type, OAMEntryType):
@@ -548,11 +653,11 @@ class TypeChecker:
         # Type check the procedure call, siden det er en statement, så vi skal bare tjekke den
         self.check_node(node.call)
         
-        return VoidType()
+        return VOID
     
     def check_ProcedureCall(self, node: ProcedureCall) -> Type:
         """Type check a ProcedureCall node."""
-        logger.info(f"Type checking procedure call: {node.name}")
+        logger.info("Type checking procedure call: %s", node.name)
         
         # get the procedure name
         proc_name = self.get_procedure_name(node)
@@ -566,20 +671,21 @@ class TypeChecker:
             raise UndeclaredVariableError(f"Undeclared procedure: {proc_name}")
 
         # access the actual params given as input
-        param_types, return_type = proc
+        params, param_types, return_type = proc
         
         # Tjek om typer og parameternavne kan mappes
         if len(node.params) != len(param_types):
             logger.error(f"Procedure '{proc_name}' expects {len(param_types)} arguments, got {len(node.params)}")
             raise TypeMismatchError(f"Procedure '{proc_name}' expects {len(param_types)} arguments, got {len(node.params)}")
         
-        # type check each of the actual arguments
-        # loop over each argument and its corresponding parameter by index of a mapped tuple
-        for i, (arg, (param_name, expected_type)) in enumerate(zip(node.params, param_types)):
+        # type check each of the actual arguments against the parameter type at the same position
+        check_node = self.check_node
+        for i, (arg, expected_type) in enumerate(zip(node.params, param_types)):
             # check the type of the argument
-            actual_type = self.check_node(arg)
+            actual_type = check_node(arg)
             # see if the type of the argument matches the expected type from the procedure table
-            if actual_type != expected_type:
+            if actual_type is not expected_type and actual_type != expected_type:
+                param_name = params[i][0]
                 logger.error(f"Argument {i+1} ('{param_name}') of procedure '{proc_name}' has wrong type: expected {expected_type}, got {actual_type}")
                 raise TypeMismatchError(f"Argument {i+1} ('{param_name}') of procedure '{proc_name}' has wrong type: expected {expected_type}, got {actual_type}")
 
@@ -587,54 +693,60 @@ class TypeChecker:
         node.var_type = return_type
         return return_type
     
-    def check_ProcedureDef(self, node: ProcedureDef) -> Type:
-        """Type check a ProcedureDef node."""
-        logger.info(f"Type checking procedure definition: {node.name}")
+    def register_procedure(self, node: ProcedureDef) -> None:
+        """Add the signature of a procedure to the procedure table, without checking its body."""
+        logger.info("Registering procedure signature: %s", node.name)
         
         # Check if the procedure has already been declared, dupilcate
         if self.procedures.lookup(node.name):
             logger.error(f"Duplicate procedure declaration: {node.name}")
             raise DuplicateDeclarationError(f"Procedure '{node.name}' already declared")
         
-        # process formal parameters
+        # process return type, of the procedure
+        return_type = self.string_to_type(node.return_type) if node.return_type else VOID
+        node.return_type = return_type
+        
+        # process formal parameters once: store the type on the declaration
+        # and collect it for the procedure table
         param_types = []
         for declaration in node.params: # params contains declarations of variables
             param_type = self.string_to_type(declaration.var_type)
+            declaration.var_type = param_type
             param_types.append((declaration.name, param_type))
         
-        # process return type, of the procedure
-        return_type = self.string_to_type(node.return_type) if node.return_type else VoidType()
-        node.return_type = return_type
-        
-        # logger.debug(f"return_type: {node.return_type} --- {type(node.return_type)} --- {return_type} --- {type(return_type)}")
-        
         # define the procedure in the procedure table
         self.procedures.define(node.name, param_types, return_type)
+        self._registered_procedures.add(node)
+    
+    def check_ProcedureDef(self, node: ProcedureDef) -> Type:
+        """Type check a ProcedureDef node."""
+        logger.info("Type checking procedure definition: %s", node.name)
         
-        # push a new scope for the procedure
-        self.env.push()
+        # Top level procedures are registered by check_program, nested ones when they are reached
+        if node not in self._registered_procedures:
+            self.register_procedure(node)
+        
+        return_type = node.return_type
         
-        # define the parameters in the new scope
+        # push a new scope for the procedure, holding the formal parameters
+        self.env.push()
         for declaration in node.params:
-            var_type = self.string_to_type(declaration.var_type)
-            self.env.define(declaration.name, var_type)
-            declaration.var_type = var_type
+            self.env.define(declaration.name, declaration.var_type)
         
         # save the current return type and previous return type, if we are in a nested procedure
         previous_return_type = self.current_return_type
         self.current_return_type = return_type
         
-        # check the body of the procedure
-        for statement in node.body:
-            self.check_node(statement)
-            
-        # return to the previous scope
-        self.env.pop()
+        def leave_procedure() -> None:
+            # return to the previous scope
+            self.env.pop()
+            # restore the previous return type
+            self.current_return_type = previous_return_type
         
-        # restore the previous return type
-        self.current_return_type = previous_return_type
+        # check the body of the procedure, leaving its scope once the body is done
+        self.check_statements(node.body, on_exit=leave_procedure)
         
-        return VoidType()
+        return VOID
 
 
 # Usage example
@@ -9,7 +9,7 @@ from __future__ import annotations
 # Stdlib imports
 import os
 import sys
-from typing import TYPE_CHECKING, Any, Optional, List
+from typing import TYPE_CHECKING, Any, Dict, Optional, List
 
 # Extend module paths
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -25,6 +25,39 @@ class Type:
     Type base class for the Penguin compiler.
     """
     
+    # Types carry (almost) no state, so no instance __dict__
+    __slots__ = ()
+    
+    # The shared instance of each type, keyed by class (and element type for lists)
+    _instances: Dict[Any, Type] = {}
+    
+    def __new__(cls) -> Type:
+        """Return the shared instance of the type, creating it on first use.
+        
+        Returns:
+            Type: The one instance of cls, so IntType() is IntType().
+        """
+        
+        instance = Type._instances.get(cls)
+        if instance is None:
+            instance = Type._instances[cls] = super().__new__(cls)
+        return instance
+    
+    def __reduce__(self) -> tuple:
+        """Pickle a type as a call to its constructor, which returns the shared instance again."""
+        
+        return (type(self), ())
+    
+    def __copy__(self) -> Type:
+        """Types are shared and never modified, so a copy is the type itself."""
+        
+        return self
+    
+    def __deepcopy__(self, memo: dict) -> Type:
+        """Types are shared and never modified, so a deep copy is the type itself."""
+        
+        return self
+    
     def __eq__(self, other: Any) -> bool:
         """Check if two types are equal."""
         
@@ -34,6 +67,10 @@ class Type:
         #     return False
         # return type(self) == type(other)
     
+    # Alle typer er lig hinanden ifølge __eq__, så en hash pr. klasse ville bryde reglen om at
+    # ens objekter har ens hash. Typer er derfor ikke hashable, brug type(t) som nøgle i stedet
+    __hash__ = None
+    
     def __repr__(self) -> str:
         """Type representation.
         
@@ -41,7 +78,7 @@ class Type:
             str: The name of the type.
         """
         classname = self.__class__.__name__
-        fields = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for cls in type(self).__mro__ for k in getattr(cls, '__slots__', ()) if not k.startswith('_'))
         return f"{classname}({fields})"
     
     def is_indexable(self) -> bool:
@@ -69,9 +106,7 @@ class VoidType(Type):
     Void type.
     """
     
-    def __init__(self) -> None:
-        # Store class name in __class__ attribute
-        self.__dict__["__class__"] = self.__class__.__name__
+    __slots__ = ()
    
     def __repr__(self) -> str:
         """Void type representation.
@@ -87,9 +122,7 @@ class TilesetType(Type):
     Tileset type.
     """
     
-    def __init__(self) -> None:
-        # Store class name in __class__ attribute
-        self.__dict__["__class__"] = self.__class__.__name__
+    __slots__ = ()
     
     def is_indexable(self) -> bool:
         """Tilesets can be indexed."""
@@ -99,7 +132,7 @@ class TilesetType(Type):
     def index_result_type(self) -> IntType:
         """Indexing a tileset returns an integer."""
         
-        return IntType()
+        return INT
    
     def __repr__(self) -> str:
         """Tileset type representation.
@@ -116,9 +149,7 @@ class TileMapType(Type):
     TileMap type.
     """
     
-    def __init__(self) -> None:
-        # Store class name in __class__ attribute
-        self.__dict__["__class__"] = self.__class__.__name__
+    __slots__ = ()
     
     def is_indexable(self) -> bool:
         """TileMaps can be indexed."""
@@ -128,7 +159,7 @@ class TileMapType(Type):
     def index_result_type(self) -> IntType:
         """Indexing a tilemap returns an integer."""
         
-        return IntType()
+        return INT
    
     def __repr__(self) -> str:
         """
@@ -146,9 +177,7 @@ class SpriteType(Type):
     Sprite type.
     """
     
-    def __init__(self) -> None:
-        # Store class name in __class__ attribute
-        self.__dict__["__class__"] = self.__class__.__name__
+    __slots__ = ()
    
     def __repr__(self) -> str:
         """Sprite type representation.
@@ -163,9 +192,7 @@ class SpriteType(Type):
 class IntType(Type):
     """Integer type."""
     
-    def __init__(self) -> None:
-        # Store class name in __class__ attribute
-        self.__dict__["__class__"] = self.__class__.__name__
+    __slots__ = ()
    
     def __repr__(self) -> str:
         """Integer type representation.
@@ -180,9 +207,7 @@ class IntType(Type):
 class StringType(Type):
     """String type."""
     
-    def __init__(self) -> None:
-        # Store class name in __class__ attribute
-        self.__dict__["__class__"] = self.__class__.__name__
+    __slots__ = ()
    
     def __repr__(self) -> str:
         """String type representation.
@@ -199,20 +224,10 @@ class OAMEntryType(Type):
     This allows accessing attributes like .x, .y, and .tile on OAM entries.
     """
     
-    def __init__(self) -> None:
-        """
-        Initialize OAM entry type with its valid attributes.
-        """
-        
-        # Store class name in __class__ attribute
-        self.__dict__["__class__"] = self.__class__.__name__
-        
-        # Dictionary of valid attributes and their types
-        self.attributes = {
-            "x": IntType(),
-            "y": IntType(),
-            "tile": IntType()
-        }
+    __slots__ = ()
+    
+    # Dictionary of valid attributes and their types, filled in once INT exists at the bottom of the module
+    attributes: Dict[str, Type] = {}
     
     def get_attribute_type(self, attr_name: str) -> Type:
         """Get the type of an attribute.
@@ -238,20 +253,34 @@ class OAMEntryType(Type):
 
 class ListType(Type):
     """List type."""
+    
+    __slots__ = ('element_type', '_repr')
    
-    def __init__(self, element_type: Optional[Type] = None) -> None:
+    def __new__(cls, element_type: Optional[Type] = None) -> ListType:
         """
-        List type constructor.
+        List type constructor, returning the shared list type for the element type.
         
         Args:
             element_type (Type, optional): The type of the elements in the list.
                 For user-defined lists, this will always be IntType.
                 For predefined lists, this can be any type specified.
         """
-        # Store class name in __class__ attribute
-        self.__dict__["__class__"] = self.__class__.__name__
+        if element_type is None:
+            element_type = INT
+        
+        # element types are shared instances themselves, so they can key the cache by identity
+        key = (cls, id(element_type))
+        instance = Type._instances.get(key)
+        if instance is None:
+            instance = Type._instances[key] = object.__new__(cls)
+            instance.element_type = element_type
+            instance._repr = f"List[{element_type}]"  # the instance is shared, so its representation is built once
+        return instance
+    
+    def __reduce__(self) -> tuple:
+        """Pickle a list type as a call to its constructor with its element type."""
         
-        self.element_type = element_type if element_type is not None else IntType()
+        return (ListType, (self.element_type,))
     
     def is_indexable(self) -> bool:
         """Lists can be indexed."""
@@ -266,6 +295,9 @@ class ListType(Type):
     def __eq__(self, other: Any) -> bool:
         """Check if two list types are equal."""
         
+        if self is other:
+            return True
+        
         if not isinstance(other, ListType):
             return False
         
@@ -278,7 +310,7 @@ class ListType(Type):
             str: The name of the type.
         """
         
-        return f"List[{self.element_type}]"
+        return self._repr
 
 
 class ProcedureType:
@@ -298,3 +330,11 @@ TILESET = TilesetType()
 TILEMAP = TileMapType()
 SPRITE = SpriteType()
 OAM_ENTRY = OAMEntryType()
+LIST_INT = ListType(INT)
+
+# The attributes of an OAM entry are the same for every instance, so they are shared on the class
+OAMEntryType.attributes.update({
+    "x": INT,
+    "y": INT,
+    "tile": INT
+})
@@ -17,6 +17,7 @@ Help:
 # Stdlib imports
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Third-party modules
@@ -26,24 +27,62 @@ from typing_extensions import Annotated
 # Extend module paths
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Custom modules
-from src.compiler import (
-    write_output_file,
-    print_tree,
-    read_input_file,
-    concrete_syntax_tree,
-    abstact_syntax_tree,
-    typed_annotated_abstact_syntax_tree,
-    intermediate_representation,
-    register_allocation,
-    code_generation,
-    compile_rgbasm,
-    full_compile,
-)
-
 # Typer CLI instance
 app = typer.Typer()
 
+# The compiler stages after reading the file, in order, each taking the result of the one before.
+# Named by their function in src.compiler, which is only imported once a command needs it
+PIPELINE = (
+    ("cst", "concrete_syntax_tree"),
+    ("ast", "abstact_syntax_tree"),
+    ("taast", "typed_annotated_abstact_syntax_tree"),
+    ("ir", "intermediate_representation"),
+    ("ra", "register_allocation"),
+    ("codegen", "code_generation"),
+)
+
+
+@lru_cache(maxsize=1)
+def load_compiler():
+    """Import the compiler module on first use.
+    
+    The compiler pulls in the ANTLR runtime, the generated parser and every pass,
+    so commands like --help and test don't pay for importing it.
+    
+    Returns:
+        module: The src.compiler module.
+    """
+    
+    from src import compiler
+    return compiler
+
+
+def run_pipeline(input_path: str, until: str):
+    """Run the compiler stages on the input file in a single pass, stopping after a given stage.
+    
+    Args:
+        input_path (str): The input file path.
+        until (str): The name of the last stage to run, like "taast" or "codegen".
+    
+    Returns:
+        The result of the last stage.
+    """
+    
+    # Check the stage before doing any work, rather than after running every stage
+    stage_names = [name for name, _ in PIPELINE]
+    if until not in stage_names:
+        raise ValueError(f"Unknown compiler stage: {until}, expected one of {', '.join(stage_names)}")
+    
+    compiler = load_compiler()
+    
+    result = compiler.read_input_file(input_path)
+    for name, stage in PIPELINE:
+        result = getattr(compiler, stage)(result)
+        if name == until:
+            break
+    
+    return result
+
 
 # Define the command line interface (CLI) for the project
 @app.command()
@@ -62,8 +101,9 @@ def test():
 def cst(input_path: Annotated[str, typer.Argument(help="Input file path")]):
     print("AST function called with input:", input_path)
     
-    input_stream = read_input_file(input_path)
-    cst = concrete_syntax_tree(input_stream, p=True)
+    compiler = load_compiler()
+    input_stream = compiler.read_input_file(input_path)
+    cst = compiler.concrete_syntax_tree(input_stream, p=True)
     print("made cst : " + type(cst))
     
 
@@ -71,33 +111,24 @@ def cst(input_path: Annotated[str, typer.Argument(help="Input file path")]):
 def ast(input_path: Annotated[str, typer.Argument(help="Input file path")]):
     print("AST function called with input:", input_path)
     
-    input_stream = read_input_file(input_path)
-    cst = concrete_syntax_tree(input_stream)
-    ast = abstact_syntax_tree(cst)
-    print_tree(ast)
+    ast = run_pipeline(input_path, "ast")
+    load_compiler().print_tree(ast)
 
 
 @app.command()
 def taast(input_path: Annotated[str, typer.Argument(help="Input file path")]):
     print("Typed AST function called with input:", input_path)
     
-    input_stream = read_input_file(input_path)
-    cst = concrete_syntax_tree(input_stream)
-    ast = abstact_syntax_tree(cst)
-    taast = typed_annotated_abstact_syntax_tree(ast)
+    taast = run_pipeline(input_path, "taast")
     
-    print_tree(taast)
+    load_compiler().print_tree(taast)
 
 
 @app.command()
 def ir(input_path: Annotated[str, typer.Argument(help="Input file path")]):
     print("Generating IR for input:", input_path)
     
-    input_stream = read_input_file(input_path)
-    cst = concrete_syntax_tree(input_stream)
-    ast = abstact_syntax_tree(cst)
-    taast = typed_annotated_abstact_syntax_tree(ast)
-    ir = intermediate_representation(taast)
+    ir = run_pipeline(input_path, "ir")
     
     print("IR STARTS HERE")
     print(ir)  # This will call __str__ on the IRProgram object
@@ -108,12 +139,7 @@ def ir(input_path: Annotated[str, typer.Argument(help="Input file path")]):
 def ra(input_path: Annotated[str, typer.Argument(help="Input file path")]):
     print("Generating IR for input:", input_path)
     
-    input_stream = read_input_file(input_path)
-    cst = concrete_syntax_tree(input_stream)
-    ast = abstact_syntax_tree(cst)
-    taast = typed_annotated_abstact_syntax_tree(ast)
-    ir = intermediate_representation(taast)
-    ra = register_allocation(ir)
+    ra = run_pipeline(input_path, "ra")
     
     print("RA STARTS HERE")
     print(ra)  # This will call __str__ on the IRProgram object
@@ -124,22 +150,16 @@ def ra(input_path: Annotated[str, typer.Argument(help="Input file path")]):
 def codegen(input_path: Annotated[str, typer.Argument(help="Input file path")], 
             output_path: Annotated[str, typer.Argument(help="Output file path")] = "out.asm"):
     print("Generating code for input:", input_path)    
-    input_stream = read_input_file(input_path)
-    cst = concrete_syntax_tree(input_stream)
-    ast = abstact_syntax_tree(cst)
-    taast = typed_annotated_abstact_syntax_tree(ast)
-    ir = intermediate_representation(taast)
-    ra = register_allocation(ir)
-    rgbasm_code = code_generation(ra)
+    rgbasm_code = run_pipeline(input_path, "codegen")
     
     output_dir = Path(output_path).parent
-    write_output_file(f"{output_dir}/main.asm", rgbasm_code)
+    load_compiler().write_output_file(f"{output_dir}/main.asm", rgbasm_code)
     
 
 @app.command()
 def compile(input_path: Annotated[str, typer.Argument(help="Input file path")],
             output_path: Annotated[str, typer.Argument(help="Output file path")] = "out.gb"):
-    full_compile(input_path, output_path, True)
+    load_compiler().full_compile(input_path, output_path, True)
     
 
 if __name__ == "__main__":
@@ -38,7 +38,7 @@ class ASTEncoder(json.JSONEncoder):
             # Add class name for reconstruction
             result["__class__"] = obj.__class__.__name__
             # Add all attributes
-            for key, value in obj.__dict__.items():
+            for key, value in obj.iter_fields():
                 result[key] = value
                 
             return result
@@ -60,7 +60,7 @@ class ASTEncoder(json.JSONEncoder):
             # Add class name for reconstruction
             result["__class__"] = obj.__class__.__name__
             # Add all attributes
-            for key, value in obj.__dict__.items():
+            for key, value in obj.iter_fields():
                 result[key] = value
             return result
         # Special case for Type objects including VoidType, IntType, etc.
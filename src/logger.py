@@ -7,7 +7,10 @@ Sets up and defiens the logger for the compiler.
 import logging
 
 logger = logging.getLogger("penguin")
-logger.setLevel(logging.DEBUG)
+
+# Loggerens niveau følger konsol handleren. Med DEBUG her blev der oprettet en log record for hvert
+# logger.debug kald, som handleren alligevel smed væk. Sæt begge til DEBUG for at se debug output.
+logger.setLevel(logging.INFO)
 
 formatter = logging.Formatter("[%(levelname)s] %(message)s")
 
@@ -30,29 +30,29 @@ def initialize_hardware_elements() -> Tuple[Dict[str, Type], Dict[str, Tuple[Lis
    
     # Display subsystems - these are special hardware elements
     # They are of their specific type, but can be indexed like arrays
-    symbol_table["display_tileset0"] = TilesetType()  # Tileset that can be indexed
-    symbol_table["display_tilemap0"] = TileMapType()  # TileMap that can be indexed
+    symbol_table["display_tileset0"] = TILESET  # Tileset that can be indexed
+    symbol_table["display_tilemap0"] = TILEMAP  # TileMap that can be indexed
     
     # OAM (Object Attribute Memory) is a special list that contains sprite attributes
-    symbol_table["display_oam_x"] = ListType(IntType())  # List of OAM entries
-    symbol_table["display_oam_y"] = ListType(IntType())   # List of OAM entries
-    symbol_table["display_oam_tile"] = ListType(IntType())   # List of OAM entries
-    symbol_table["display_oam_attr"] = ListType(IntType())   # List of OAM entries
+    symbol_table["display_oam_x"] = LIST_INT  # List of OAM entries
+    symbol_table["display_oam_y"] = LIST_INT  # List of OAM entries
+    symbol_table["display_oam_tile"] = LIST_INT  # List of OAM entries
+    symbol_table["display_oam_attr"] = LIST_INT  # List of OAM entries
    
     # Control functions
-    procedure_table["control_LCDon"] = ([], VoidType())
-    procedure_table["control_LCDoff"] = ([], VoidType())
-    procedure_table["control_waitVBlank"] = ([], VoidType())
-    procedure_table["control_updateInput"] = ([], VoidType())
+    procedure_table["control_LCDon"] = ([], VOID)
+    procedure_table["control_LCDoff"] = ([], VOID)
+    procedure_table["control_waitVBlank"] = ([], VOID)
+    procedure_table["control_updateInput"] = ([], VOID)
    
     # Input flags - these are boolean values represented as integers
-    symbol_table["input_Right"] = IntType()
-    symbol_table["input_Left"] = IntType()
-    symbol_table["input_Up"] = IntType()
-    symbol_table["input_Down"] = IntType()
-    symbol_table["input_A"] = IntType()
-    symbol_table["input_B"] = IntType()
-    symbol_table["input_Start"] = IntType()
-    symbol_table["input_Select"] = IntType()
+    symbol_table["input_Right"] = INT
+    symbol_table["input_Left"] = INT
+    symbol_table["input_Up"] = INT
+    symbol_table["input_Down"] = INT
+    symbol_table["input_A"] = INT
+    symbol_table["input_B"] = INT
+    symbol_table["input_Start"] = INT
+    symbol_table["input_Select"] = INT
    
     return symbol_table, procedure_table
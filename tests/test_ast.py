@@ -132,6 +132,17 @@ class TestASTExpressions:
         assert ast.statements[0].value.left.op == "+"
         assert isinstance(ast.statements[0].value.right, Variable)
         assert ast.statements[0].value.right.name == "c"
+
+    def test_left_associative_chain(self):
+        ast = build_ast("x = a - b - -c;")
+        
+        value = ast.statements[0].value
+        assert isinstance(value, BinaryOp)
+        assert isinstance(value.left, BinaryOp)
+        assert (value.left.left.name, value.left.right.name) == ("a", "b")
+        assert isinstance(value.right, UnaryOp)
+        assert value.right.op == "-"
+        assert value.right.operand.name == "c"
     
 
 class TestASTLiterals:
@@ -160,6 +171,21 @@ class TestASTLiterals:
         assert isinstance(ast.statements[0].value, IntegerLiteral)
         assert ast.statements[0].value.value == 42  # 0b101010 = 42
 
+    def test_literals_are_shared(self):
+        ast = build_ast("x = 42; y = 42; z = 7;")
+        
+        assert ast.statements[0].value is ast.statements[1].value
+        assert ast.statements[0].value is not ast.statements[2].value
+    
+    def test_shared_literals_are_not_changed(self):
+        import copy
+        
+        one = IntegerLiteral(1)
+        assert IntegerLiteral(True) is not one
+        assert one.value == 1 and type(one.value) is int
+        assert copy.deepcopy(one) is one
+        assert copy.copy(StringLiteral("x")) is StringLiteral("x")
+
 
 class TestASTConditionals:
     def test_conditional_statement(self):
@@ -190,6 +216,31 @@ class TestASTConditionals:
         assert isinstance(ast.statements[0].else_body[0].value, IntegerLiteral)
         assert ast.statements[0].else_body[0].value.value == 2
 
+    def test_conditional_child_nodes(self):
+        ast = build_ast("if (x > 0) { y = 1; } else { y = 2; }")
+        conditional = ast.statements[0]
+
+        children = list(conditional.iter_child_nodes())
+        assert children == [conditional.condition, conditional.then_body[0], conditional.else_body[0]]
+    
+    def test_variable_child_nodes(self):
+        attribute = AttributeAccess(Variable(None, "a"), "b")
+        
+        assert list(Variable(None, attribute).iter_child_nodes()) == [attribute]
+        assert list(Variable(None, "a").iter_child_nodes()) == []
+    
+    def test_subclass_without_constructor(self):
+        class Marker(ASTNode):
+            pass
+        
+        class Sum(BinaryOp):
+            pass
+        
+        assert Marker._fields == ()
+        assert list(Marker().iter_child_nodes()) == []
+        assert Sum._fields == BinaryOp._fields
+        assert Sum._node_fields == ("left", "right")
+
 
 class TestASTLoops:
     def test_loop_statement(self):
@@ -351,3 +402,29 @@ class TestASTComplexStructures:
         assert isinstance(ast.statements[0].then_body[0].body[1], Conditional)
         assert len(ast.statements[0].else_body) == 1
         assert isinstance(ast.statements[0].else_body[0], ProcedureCallStatement)
+
+    def test_structural_equality(self):
+        code = "int x = 1 + y[2]; print(x.a);"
+        
+        assert build_ast(code).same_structure(build_ast(code))
+        assert not build_ast(code).same_structure(build_ast("int x = 1 + y[3]; print(x.a);"))
+        # nodes themselves compare and hash by identity
+        assert build_ast(code) != build_ast(code)
+        assert len({Variable(None, "a"), Variable(None, "a")}) == 2
+    
+    def test_structural_equality_long_chain(self):
+        code = "x = " + " + ".join(["a"] * 3000) + ";"
+        
+        assert build_ast(code).same_structure(build_ast(code))
+        assert not build_ast(code).same_structure(build_ast(code.replace("a;", "b;")))
+
+
+class TestASTGeneratorDispatch:
+    def test_every_context_has_handler(self):
+        """Every parser context must dispatch to a method on ASTGenerator, not the generated visitChildren default."""
+        from src.astGenerator import CONTEXT_CLASSES
+        from src.generated.penguinVisitor import penguinVisitor
+        
+        for context_class in CONTEXT_CLASSES:
+            handler = getattr(ASTGenerator, context_class._visit_name)
+            assert handler is not getattr(penguinVisitor, context_class._visit_name), context_class.__name__
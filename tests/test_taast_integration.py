@@ -311,6 +311,14 @@ class TestTypeProcedureDef:
         assert isinstance(taast.statements[0].params[0].var_type, IntType), "proc def param dec -> int"
         assert isinstance(taast.statements[0].body[0].target.var_type, IntType), "proc def body dec -> int"
     
+    def test_procedure_forward_call(self):
+        # procedures can be called before they are defined
+        taast = build_taast("int x = foo(2); procedure int foo(int y) { return y; }")
+        assert isinstance(taast.statements[0].value.var_type, IntType), "forward call -> int"
+        
+        with pytest.raises(DuplicateDeclarationError):
+            build_taast("procedure foo() { int a; } procedure foo() { int b; }")
+    
     def test_procedure_def_scope2(self):
         # test procedure definition inside and outside body scope. should overwrite the one outside
         try:
@@ -333,6 +341,16 @@ class TestTypeProcedureDef:
         except Exception as e:
             assert False, "child scope in formal param not overwriting parent scope --- " + str(e)
 
+    def test_procedure_def_scope_restored(self):
+        # parameter shadowing a global should be gone again after the procedure
+        taast = build_taast("sprite q; procedure foo(int q) { q = 1; } q = 2;")
+        assert isinstance(taast.statements[1].body[0].target.var_type, IntType), "shadowed param -> int"
+        assert isinstance(taast.statements[2].target.var_type, SpriteType), "global after proc -> sprite"
+
+        # variables declared in a procedure should not leak out of it
+        with pytest.raises(UndeclaredVariableError):
+            build_taast("procedure foo() { int y; } y = 2;")
+
 
 class TestBinaryOp: # TODO
     def test_arithmetic_binary_op(self):
@@ -418,6 +436,12 @@ class TestBinaryOp: # TODO
         assert isinstance(taast.statements[0].value.var_type, IntType), "comparison op -> int"
         assert isinstance(taast.statements[0].value.left.var_type, IntType), "comparison op left -> int"
         assert isinstance(taast.statements[0].value.right.var_type, IntType), "comparison op right -> int"
+    
+    def test_long_binary_op_chain(self):
+        # a chain nests as deep as it is long, deeper than the recursion limit
+        taast = build_taast("int x = " + " + ".join(["-1"] * 2000) + ";")
+        assert isinstance(taast.statements[0].value.var_type, IntType), "long chain -> int"
+        assert isinstance(taast.statements[0].value.right, UnaryOp), "long chain right -> unary op"
 
 
 class TestUnaryOp:
@@ -619,3 +643,31 @@ class TestTypeProcedureCallInExpression:
         assert isinstance(taast.statements[1].value, ProcedureCall), "init -> ProcedureCall"
         assert isinstance(taast.statements[1].value.var_type, IntType), "proc call -> int"
         assert isinstance(taast.statements[1].value.params[0].var_type, IntType), "proc call param (Variable) -> int"
+
+
+class TestTypeHashing:
+    def test_types_are_unhashable(self):
+        # every type compares equal to every other type, so no hash could be consistent with __eq__
+        # (builtins.TypeError, since src.customErrors shadows the name)
+        import builtins
+        with pytest.raises(builtins.TypeError):
+            hash(IntType())
+        with pytest.raises(builtins.TypeError):
+            hash(ListType())
+    
+    def test_types_are_shared(self):
+        assert IntType() is IntType(), "IntType -> one instance"
+        assert ListType() is ListType(IntType()), "ListType of int -> one instance"
+        assert ListType(StringType()) is not ListType(), "ListType of string -> own instance"
+    
+    def test_copied_types_stay_shared(self):
+        import copy
+        import pickle
+        from src.astTypes import INT, LIST_INT
+        
+        string_list = ListType(StringType())
+        assert copy.copy(string_list) is string_list, "copy ListType -> same instance"
+        assert copy.deepcopy(string_list) is string_list, "deepcopy ListType -> same instance"
+        assert pickle.loads(pickle.dumps(string_list)) is string_list, "pickle ListType -> same instance"
+        assert copy.copy(IntType()) is INT, "copy IntType -> INT"
+        assert LIST_INT.element_type is INT, "copying must not change the shared int list"